@@ -541,6 +541,51 @@ class EnhancedBrowserManager:
         
         return unique_elements[:50]
     
+    # Union of the primary card selectors used by get_business_cards -
+    # evaluated in-page so one JS call replaces a find_elements round-trip
+    # plus per-card .text reads
+    _CARD_SNAPSHOT_JS = """
+    const cards = Array.from(document.querySelectorAll(
+        'div[role="article"], .Nv2PK, .THOPZb, div[role="feed"] > div > div[jsaction]'
+    )).filter(c => c.offsetParent !== null && c.innerText && c.innerText.trim().length > 3);
+    return cards.slice(0, 50).map((c, i) => {
+        const anchor = c.matches('a[href*="maps/place"]') ? c : c.querySelector('a[href*="maps/place"]');
+        return {
+            index: i,
+            text: c.innerText,
+            name: c.querySelector('.qBF1Pd') ? c.querySelector('.qBF1Pd').innerText : null,
+            href: anchor ? anchor.href : null
+        };
+    });
+    """
+
+    _CARD_CLICK_JS = """
+    const cards = Array.from(document.querySelectorAll(
+        'div[role="article"], .Nv2PK, .THOPZb, div[role="feed"] > div > div[jsaction]'
+    )).filter(c => c.offsetParent !== null && c.innerText && c.innerText.trim().length > 3);
+    const card = cards[arguments[0]];
+    if (!card) return false;
+    card.click();
+    return true;
+    """
+
+    def get_business_card_snapshots(self) -> List[Dict[str, Any]]:
+        """Read index/text/name of all visible cards in one JS round-trip"""
+        try:
+            snapshots = self.driver.execute_script(self._CARD_SNAPSHOT_JS)
+            return snapshots or []
+        except Exception as e:
+            self.logger.debug(f"Card snapshot failed: {str(e)}")
+            return []
+
+    def click_card_by_index(self, index: int) -> bool:
+        """Click the nth visible card via JS (no element handle round-trips)"""
+        try:
+            return bool(self.driver.execute_script(self._CARD_CLICK_JS, index))
+        except Exception as e:
+            self.logger.debug(f"Card click failed at index {index}: {str(e)}")
+            return False
+
     def extract_business_details(self) -> Dict[str, Any]:
         """Extract ALL business details including premium fields"""
         details = {
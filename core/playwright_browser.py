@@ -0,0 +1,138 @@
+"""
+Playwright Browser Manager for Google Maps Scraper Pro
+Drop-in alternative to EnhancedBrowserManager - Playwright keeps one
+persistent websocket to the browser, so there is no per-command HTTP
+round-trip like the Selenium wire protocol
+"""
+
+import logging
+from typing import Optional, Dict, Any, List
+
+from selenium.common.exceptions import NoSuchElementException
+
+from core.enhanced_browser import EnhancedBrowserManager
+
+try:
+    from playwright.sync_api import sync_playwright
+except ImportError:
+    sync_playwright = None
+
+class PlaywrightBrowserManager:
+    """
+    Browser manager with the same surface as EnhancedBrowserManager
+    (start_browser, card snapshots, click-by-index, close_browser).
+    Exposes itself as `driver` so Selenium-style call sites
+    (driver.get / driver.execute_script / WebDriverWait) keep working.
+    """
+
+    # Shared with the Selenium manager so both engines see the same cards
+    _CARD_SNAPSHOT_JS = EnhancedBrowserManager._CARD_SNAPSHOT_JS
+    _CARD_CLICK_JS = EnhancedBrowserManager._CARD_CLICK_JS
+
+    def __init__(self, config: Dict[str, Any], proxy_rotator=None):
+        if sync_playwright is None:
+            raise ImportError("playwright is not installed - pip install playwright")
+
+        self.config = config
+        self.proxy_rotator = proxy_rotator
+        self.logger = logging.getLogger(__name__)
+        self._playwright = None
+        self.browser = None
+        self.page = None
+
+        # Selenium-style call sites go through browser.driver
+        self.driver = self
+
+    def start_browser(self) -> bool:
+        """Start a Chromium instance with a persistent context"""
+        headless = self.config.get('advanced_settings', {}).get('headless', False)
+
+        self._playwright = sync_playwright().start()
+        self.browser = self._playwright.chromium.launch(headless=headless)
+        self.page = self.browser.new_page()
+        self.logger.info("✓ Playwright browser started")
+        return True
+
+    # ------------------------------------------------------------------
+    # Selenium-driver compatible shims
+    # ------------------------------------------------------------------
+
+    def get(self, url: str):
+        """Navigate like selenium's driver.get"""
+        self.page.goto(url)
+
+    def execute_script(self, script: str, *args):
+        """Run a Selenium-style JS snippet (supports return / arguments[n])"""
+        wrapped = ("(args) => { return (function() { "
+                   + script +
+                   " }).apply(null, args); }")
+        return self.page.evaluate(wrapped, list(args))
+
+    def find_element(self, by, selector: str):
+        """CSS-selector lookup; raises like Selenium when missing"""
+        element = self.page.query_selector(selector)
+        if element is None:
+            raise NoSuchElementException(f"No element matches: {selector}")
+        return element
+
+    def find_elements(self, by, selector: str) -> List[Any]:
+        """CSS-selector lookup returning all matches"""
+        return self.page.query_selector_all(selector)
+
+    # ------------------------------------------------------------------
+    # Card API (mirrors EnhancedBrowserManager)
+    # ------------------------------------------------------------------
+
+    def get_business_cards(self) -> List[Any]:
+        """Get business card element handles"""
+        try:
+            return self.page.query_selector_all('div[role="feed"] > div > div[jsaction]')
+        except Exception as e:
+            self.logger.debug(f"Card lookup failed: {str(e)}")
+            return []
+
+    def get_business_card_snapshots(self) -> List[Dict[str, Any]]:
+        """Read index/text/name/href of all visible cards in one evaluate"""
+        try:
+            snapshots = self.execute_script(self._CARD_SNAPSHOT_JS)
+            return snapshots or []
+        except Exception as e:
+            self.logger.debug(f"Card snapshot failed: {str(e)}")
+            return []
+
+    def click_card_by_index(self, index: int) -> bool:
+        """Click the nth visible card via JS"""
+        try:
+            return bool(self.execute_script(self._CARD_CLICK_JS, index))
+        except Exception as e:
+            self.logger.debug(f"Card click failed at index {index}: {str(e)}")
+            return False
+
+    def safe_click(self, element) -> bool:
+        """Click an element handle, swallowing failures"""
+        try:
+            element.click()
+            return True
+        except Exception as e:
+            self.logger.debug(f"Click failed: {str(e)}")
+            return False
+
+    def wait_for_element(self, by, selector: str, timeout: int = 10) -> Optional[Any]:
+        """Wait for an element to appear"""
+        try:
+            return self.page.wait_for_selector(selector, timeout=timeout * 1000)
+        except Exception:
+            return None
+
+    def close_browser(self):
+        """Close the browser and stop Playwright"""
+        try:
+            if self.page:
+                self.page.close()
+            if self.browser:
+                self.browser.close()
+            if self._playwright:
+                self._playwright.stop()
+            self.logger.info("Browser closed")
+        except Exception as e:
+            self.logger.debug(f"Error closing browser: {str(e)}")
@@ -1,6 +1,6 @@
 import sqlite3
 import psycopg2
-from sqlalchemy import create_engine, Column, String, Float, Integer, DateTime, JSON, Boolean, Text
+from sqlalchemy import create_engine, insert, Column, String, Float, Integer, DateTime, JSON, Boolean, Text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import QueuePool
@@ -48,6 +48,9 @@ class Business(Base):
     enrichment_data = Column(JSON)
     tags = Column(JSON)
 
+# Mapped column names, precomputed once for insert_many's row sanitization
+Business._scrapable_fields = frozenset(c.name for c in Business.__table__.columns)
+
 class DatabaseManager:
     """Manages database operations for multiple database types"""
     
@@ -76,11 +79,15 @@ class DatabaseManager:
                     pool_pre_ping=True
                 )
             elif self.db_type == 'postgresql':
+                # Batch executemany into multi-row VALUES clauses so bulk
+                # ingestion costs ceil(N/page) round-trips instead of N
                 self.engine = create_engine(
                     self.connection_string,
                     pool_size=10,
                     max_overflow=20,
-                    pool_pre_ping=True
+                    pool_pre_ping=True,
+                    executemany_mode='values_plus_batch',
+                    executemany_values_page_size=1000
                 )
             elif self.db_type == 'mysql':
                 self.engine = create_engine(
@@ -143,36 +150,79 @@ class DatabaseManager:
     def insert_many(self, businesses: List[Dict]) -> int:
         """Insert multiple businesses efficiently"""
         inserted = 0
-        
+
         try:
             with self.session_scope() as session:
+                # Find which ids already exist in one query
+                ids = [b.get('id') for b in businesses if b.get('id')]
+                existing_ids = set()
+                if ids:
+                    existing_ids = {
+                        row[0] for row in
+                        session.query(Business.id).filter(Business.id.in_(ids)).all()
+                    }
+
+                new_records = []
                 for business_data in businesses:
                     try:
-                        existing = session.query(Business).filter_by(id=business_data.get('id')).first()
-                        
-                        if existing:
+                        if business_data.get('id') in existing_ids:
+                            existing = session.query(Business).filter_by(id=business_data.get('id')).first()
                             for key, value in business_data.items():
                                 if hasattr(existing, key):
                                     setattr(existing, key, value)
                             existing.updated_at = datetime.utcnow()
+                            inserted += 1
                         else:
-                            business = Business(**business_data)
-                            session.add(business)
-                        
-                        inserted += 1
-                        
-                        # Commit in batches
-                        if inserted % 100 == 0:
-                            session.flush()
-                            self.logger.info(f"Processed {inserted} records")
-                            
+                            new_records.append(business_data)
+
                     except Exception as e:
                         self.logger.error(f"Error processing business: {str(e)}")
                         continue
-                        
+
+                # Batched INSERT - one executemany instead of N
+                # session.add(). Rows are sanitized to mapped columns
+                # and grouped by key set (executemany needs homogeneous
+                # keys; padding missing keys with None would write NULL
+                # over the primary key and the scraped_at/is_active
+                # column defaults).
+                groups = {}
+                for record in new_records:
+                    clean = {k: v for k, v in record.items()
+                             if k in Business._scrapable_fields}
+                    if clean:
+                        groups.setdefault(frozenset(clean), []).append(clean)
+
+                batch_inserted = 0
+                for rows in groups.values():
+                    try:
+                        with session.begin_nested():
+                            session.execute(insert(Business), rows)
+                        batch_inserted += len(rows)
+                    except (AttributeError, TypeError, NameError):
+                        # Programming errors would just recur per row -
+                        # surface them instead of logging a failed batch
+                        raise
+                    except Exception as e:
+                        self.logger.error(f"Batch insert failed, retrying per row: {str(e)}")
+                        # Savepoint per row so only the bad rows are
+                        # skipped, like the baseline per-row loop
+                        for row in rows:
+                            try:
+                                with session.begin_nested():
+                                    session.execute(insert(Business), [row])
+                                batch_inserted += 1
+                            except Exception as row_e:
+                                self.logger.error(f"Error inserting business: {str(row_e)}")
+
+                inserted += batch_inserted
+                if batch_inserted:
+                    self.logger.info(f"Batch inserted {batch_inserted} new records")
+
+        except (AttributeError, TypeError, NameError):
+            raise
         except Exception as e:
             self.logger.error(f"Batch insert failed: {str(e)}")
-        
+
         return inserted
     
     def query_businesses(self, filters: Dict = None, limit: int = 100) -> List[Business]:
@@ -2,6 +2,7 @@ from sqlalchemy import Column, String, Float, Integer, DateTime, JSON, Boolean,
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
+from typing import Dict
 import uuid
 
 Base = declarative_base()
@@ -78,38 +79,20 @@ class Business(Base):
     keywords = Column(JSON)
     
     # Operations
-    opening_hours = Column(JSON)  # Structured hours data
-    special_hours = Column(JSON)  # Holiday hours
-    popular_times = Column(JSON)  # Busy times data
     timezone = Column(String(50))
-    
+
     # Attributes
     price_range = Column(String(10))
     price_level = Column(Integer)  # 0-4 scale
-    amenities = Column(JSON)
-    payment_methods = Column(JSON)
     languages_spoken = Column(JSON)
-    
+
     # Accessibility
     wheelchair_accessible = Column(Boolean)
-    parking = Column(JSON)  # {free: true, valet: false, street: true}
-    accessibility_features = Column(JSON)
-    
-    # Health and safety
-    health_safety = Column(JSON)  # COVID-19 measures etc.
-    certifications = Column(JSON)
-    
+
     # Media
     photos_count = Column(Integer, default=0)
-    photos = Column(JSON)  # URLs to photos
-    videos = Column(JSON)
     logo_url = Column(String(500))
-    
-    # Reviews
-    recent_reviews = Column(JSON)  # Last 5-10 reviews
-    featured_review = Column(JSON)
-    review_highlights = Column(JSON)  # Keywords from reviews
-    
+
     # Verification
     verified = Column(Boolean, default=False)
     claimed = Column(Boolean, default=False)
@@ -140,7 +123,6 @@ class Business(Base):
     social_media_active = Column(Boolean, default=False)
     
     # Enrichment data
-    enrichment_data = Column(JSON)  # Data from third-party APIs
     enrichment_sources = Column(JSON)  # Which sources were used
     enrichment_timestamp = Column(DateTime)
     
@@ -161,6 +143,10 @@ class Business(Base):
     last_verified = Column(DateTime)
     
     # Relationships
+    # Cold JSON blobs live on a 1:1 sidecar row; lazy='raise' forces callers
+    # to opt in (selectinload) before paying to load them
+    details = relationship("BusinessDetails", uselist=False, back_populates="business",
+                           cascade="all, delete-orphan", lazy='raise')
     tags = relationship("Tag", secondary=business_tags, back_populates="businesses")
     categories = relationship("Category", secondary=business_categories, back_populates="businesses")
     reviews = relationship("Review", back_populates="business", cascade="all, delete-orphan")
@@ -176,9 +162,32 @@ class Business(Base):
     
     def update_from_scrape(self, data: Dict):
         """Update business from scraped data"""
+        # Set membership beats hasattr's MRO/descriptor walk per key
+        detail_updates = {}
         for key, value in data.items():
-            if hasattr(self, key) and value is not None:
+            if value is None:
+                continue
+            if key in Business._scrapable_fields:
                 setattr(self, key, value)
+            elif key in BusinessDetails._detail_fields:
+                # Cold columns (opening_hours, amenities, ...) live on
+                # the sidecar row
+                detail_updates[key] = value
+
+        if detail_updates:
+            # lazy='raise' relationship: persistent instances must be
+            # loaded with selectinload(Business.details) to update
+            # cold fields; new instances just get a fresh sidecar row
+            try:
+                details = self.details
+            except Exception:
+                details = None
+            if details is None:
+                details = BusinessDetails()
+                self.details = details
+            for key, value in detail_updates.items():
+                setattr(details, key, value)
+
         self.last_scraped = datetime.utcnow()
     
     def calculate_quality_score(self):
@@ -194,8 +203,14 @@ class Business(Base):
         if self.address: score += 1
         if self.latitude and self.longitude: score += 1
         
+        # Cold fields live on the details sidecar (may not be loaded)
+        try:
+            details = self.details
+        except Exception:
+            details = None
+
         # Important fields
-        if self.opening_hours: score += 1
+        if details and details.opening_hours: score += 1
         if self.rating: score += 1
         if self.reviews_count > 10: score += 1
         if self.social_media: score += 1
@@ -208,16 +223,66 @@ class Business(Base):
         # Completeness
         if self.description: score += 1
         if self.photos_count > 5: score += 1
-        if self.amenities: score += 1
-        
+        if details and details.amenities: score += 1
+
         # Business details
         if self.year_established: score += 1
         if self.business_type: score += 1
-        if self.payment_methods: score += 1
+        if details and details.payment_methods: score += 1
         
         self.data_completeness = (score / total_fields) * 100
         return self.data_completeness
 
+# Precomputed once the table is mapped - hot path for update_from_scrape
+Business._scrapable_fields = frozenset(c.name for c in Business.__table__.columns)
+
+class BusinessDetails(Base):
+    """Cold 1:1 sidecar holding the bulky JSON blobs for a business.
+
+    Keeping these off the main businesses table keeps hot-path scans
+    (name/city/state/rating filters) narrow; load explicitly with
+    selectinload(Business.details) when the blobs are needed.
+    """
+    __tablename__ = 'business_details'
+
+    business_id = Column(String(64), ForeignKey('businesses.id'), primary_key=True)
+
+    # Operations
+    opening_hours = Column(JSON)  # Structured hours data
+    special_hours = Column(JSON)  # Holiday hours
+    popular_times = Column(JSON)  # Busy times data
+
+    # Attributes
+    amenities = Column(JSON)
+    payment_methods = Column(JSON)
+
+    # Accessibility
+    parking = Column(JSON)  # {free: true, valet: false, street: true}
+    accessibility_features = Column(JSON)
+
+    # Health and safety
+    health_safety = Column(JSON)  # COVID-19 measures etc.
+    certifications = Column(JSON)
+
+    # Media
+    photos = Column(JSON)  # URLs to photos
+    videos = Column(JSON)
+
+    # Reviews
+    recent_reviews = Column(JSON)  # Last 5-10 reviews
+    featured_review = Column(JSON)
+    review_highlights = Column(JSON)  # Keywords from reviews
+
+    # Enrichment data
+    enrichment_data = Column(JSON)  # Data from third-party APIs
+
+    # Relationship
+    business = relationship("Business", back_populates="details")
+
+# Cold-column routing table for Business.update_from_scrape
+BusinessDetails._detail_fields = frozenset(
+    c.name for c in BusinessDetails.__table__.columns) - {'business_id'}
+
 class Review(Base):
     """Business reviews model"""
     __tablename__ = 'reviews'
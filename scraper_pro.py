@@ -15,6 +15,8 @@ import signal
 import sys
 import os
 import re
+import atexit
+import operator
 import threading
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any, Generator, Set
@@ -38,6 +40,141 @@ import shutil
 from core.enhanced_browser import EnhancedBrowserManager
 from core.smart_parser import SmartParser
 
+# Compiled once at import - these run once per scraped card.
+# Single alternation, most specific (formatted) branch first so one NFA
+# pass replaces the previous three sequential searches; the old
+# unparenthesized 3-3-4 pattern was subsumed by the first branch.
+_PHONE_RE = re.compile(
+    r'(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
+    r'|(?:\+?\d{1,3}[-.\s]?)?\d{10}'
+)
+
+# Single pattern covering both "4.5" and "4,5"; search() stops at the
+# first hit instead of findall() materializing every number in the text
+_RATING_RE = re.compile(r'(\d+[.,]\d+)')
+
+def extract_phone(text: str) -> Optional[str]:
+    """Extract a phone number from free text (module-level hot path)"""
+    # Cheap C-level digit scan first - most card text has no phone at
+    # all, and any phone match needs at least 7 digits
+    if sum(map(str.isdigit, text)) < 7:
+        return None
+
+    match = _PHONE_RE.search(text)
+    if match:
+        return match.group(0)
+    return None
+
+def extract_rating(text: str) -> Optional[float]:
+    """Extract a rating like "4.5" / "4,5" from free text"""
+    # Ratings always carry a decimal separator - skip the regexes if
+    # there is none
+    if '.' not in text and ',' not in text:
+        return None
+
+    # Usually the first number is the rating
+    match = _RATING_RE.search(text)
+    if match:
+        try:
+            return float(match.group(1).replace(',', '.'))
+        except:
+            pass
+    return None
+
+# Field -> status icon for the per-card success line
+_ICON_MAP = (('phone', '📞'), ('website', '🌐'), ('address', '📍'), ('rating', '⭐'))
+
+# Advances the results feed in one jump - called every few cards instead
+# of a smooth scrollIntoView round-trip per card
+_FEED_SCROLL_JS = """
+const feed = document.querySelector('div[role="feed"]');
+if (!feed) return 0;
+feed.scrollTop += 1200;
+return feed.scrollHeight;
+"""
+
+# Fallback for the JS detail extraction: one XPath union finds every
+# candidate element in a single driver call, classified Python-side
+_DETAIL_XPATH = (
+    '//button[contains(@data-item-id,"phone")]'
+    ' | //a[starts-with(@href,"tel:")]'
+    ' | //button[contains(@data-item-id,"address")]'
+    ' | //button[contains(@jsaction,"category")]'
+    ' | //a[contains(@data-item-id,"authority")]'
+    ' | //a[starts-with(@href,"http") and not(contains(@href,"google.com"))]'
+)
+
+def _apply_detail_element(element, business: Dict):
+    """Classify one XPath-union hit into the business dict"""
+    item_id = element.get_attribute('data-item-id') or ''
+    jsaction = element.get_attribute('jsaction') or ''
+    href = element.get_attribute('href') or ''
+
+    if 'phone' in item_id or href.startswith('tel:'):
+        if not business.get('phone'):
+            business['phone'] = element.text or href.replace('tel:', '')
+    elif 'address' in item_id:
+        if not business.get('address'):
+            business['address'] = element.text
+    elif 'category' in jsaction:
+        if not business.get('category'):
+            business['category'] = element.text
+    elif href.startswith('http') and 'google.com' not in href:
+        if not business.get('website'):
+            business['website'] = href
+
+# Pulls phone/website/address/category from the detail panel in a single
+# WebDriver round-trip instead of four find_elements calls
+_DETAIL_EXTRACT_JS = """
+return (function() {
+    const phone = document.querySelector('button[data-item-id*="phone"], a[href^="tel:"]');
+    const addr = document.querySelector('button[data-item-id*="address"]');
+    const cat = document.querySelector('button[jsaction*="category"]');
+    let site = null;
+    for (const a of document.querySelectorAll('a[data-item-id*="authority"], a[href^="http"]')) {
+        if (a.href && a.href.startsWith('http') && !a.href.includes('google.com')) {
+            site = a.href;
+            break;
+        }
+    }
+    return {
+        phone: phone ? (phone.innerText || (phone.href || '').replace('tel:', '')) : null,
+        website: site,
+        address: addr ? addr.innerText : null,
+        category: cat ? cat.innerText : null
+    };
+})();
+"""
+
+# Fast JSON serialization - orjson (Rust) when available, stdlib fallback
+try:
+    import orjson
+
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    def json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    orjson = None
+
+    def json_dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+    def json_loads(data):
+        return json.loads(data)
+
+# Optional bloom filter - constant-memory dedup for very large scrapes
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:
+    ScalableBloomFilter = None
+
+# Exact dedup below this many ids; only beyond it does the set's memory
+# justify trading in a bloom filter's false-positive risk (same
+# threshold as utils/duplicate_remover.py)
+_BLOOM_THRESHOLD = 500_000
+
 # Suppress warnings
 warnings.filterwarnings("ignore")
 
@@ -113,25 +250,46 @@ class RateLimiter:
 class CheckpointManager:
     """Manages checkpoints for auto-resume and final conversion"""
     
-    def __init__(self, base_name: str, checkpoint_dir: str = 'output1/checkpoints', 
-                 final_dir: str = 'output1/final'):
+    def __init__(self, base_name: str, checkpoint_dir: str = 'output1/checkpoints',
+                 final_dir: str = 'output1/final', exact_dedup: bool = False):
         self.base_name = base_name
         self.checkpoint_dir = checkpoint_dir
         self.final_dir = final_dir
         self.timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        self.checkpoint_file = None
+        # One append-only checkpoint file per run - each save appends only
+        # the new batch instead of rewriting the full history (O(N) I/O)
+        self.checkpoint_file = os.path.join(
+            checkpoint_dir,
+            f"{base_name}_{self.timestamp}.jsonl"
+        )
+        # Exact-set dedup by default; mark_processed promotes to a bloom
+        # filter only once the run crosses _BLOOM_THRESHOLD ids, so small
+        # and mid-size scrapes can never drop a new business to a bloom
+        # false positive
+        self.exact_dedup = exact_dedup or ScalableBloomFilter is None
         self.processed_ids: Set[str] = set()
+        self.bloom = None
         self.last_checkpoint_count = 0
         self.checkpoint_interval = 100
         self.shutdown_requested = False
         self.shutdown_count = 0
         
+        # Single buffered append handle, opened lazily by the writer thread
+        # on the first batch so empty runs leave no file behind
+        self._ckpt_fp = None
+
+        # Background writer - keeps fsync/disk latency off the scrape loop
+        self._writeq: Queue = Queue(maxsize=8)
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+
         # Create directories
         os.makedirs(checkpoint_dir, exist_ok=True)
         os.makedirs(final_dir, exist_ok=True)
         os.makedirs(os.path.join(final_dir, 'csv'), exist_ok=True)
         os.makedirs(os.path.join(final_dir, 'excel'), exist_ok=True)
         os.makedirs(os.path.join(final_dir, 'json'), exist_ok=True)
+        os.makedirs(os.path.join(final_dir, 'parquet'), exist_ok=True)
         os.makedirs(os.path.join(final_dir, 'html'), exist_ok=True)
         os.makedirs(os.path.join(final_dir, 'summary'), exist_ok=True)
         os.makedirs('output1/logs', exist_ok=True)
@@ -164,34 +322,94 @@ class CheckpointManager:
     def is_processed(self, business: Dict) -> bool:
         """Check if business was already processed"""
         business_id = business.get('_id') or self.generate_business_id(business)
+        if self.bloom is not None:
+            return business_id in self.bloom
         return business_id in self.processed_ids
+
+    def mark_processed(self, business_id: str):
+        """Record a business id in the dedup structure"""
+        if self.bloom is not None:
+            self.bloom.add(business_id)
+            return
+
+        self.processed_ids.add(business_id)
+        # Promote to constant-memory bloom dedup only on very large
+        # scrapes, seeding it with everything seen so far
+        if (not self.exact_dedup
+                and len(self.processed_ids) >= _BLOOM_THRESHOLD):
+            self.logger.info(
+                f"Dedup set reached {_BLOOM_THRESHOLD:,} ids, switching to bloom filter")
+            self.bloom = ScalableBloomFilter(initial_capacity=1_000_000, error_rate=1e-3)
+            for processed_id in self.processed_ids:
+                self.bloom.add(processed_id)
+            self.processed_ids = set()
     
     def save_checkpoint(self, businesses: List[Dict], count: int):
-        """Save checkpoint file"""
-        checkpoint_file = os.path.join(
-            self.checkpoint_dir, 
-            f"{self.base_name}_checkpoint_{count}.jsonl"
-        )
-        
+        """Queue the new records of a checkpoint batch for the background writer"""
         try:
-            with open(checkpoint_file, 'w', encoding='utf-8') as f:
-                for business in businesses:
-                    # Add ID if not present
-                    if '_id' not in business:
-                        business['_id'] = self.generate_business_id(business)
-                    
-                    f.write(json.dumps(business, ensure_ascii=False) + '\n')
-                    self.processed_ids.add(business['_id'])
-            
+            batch = []
+            for business in businesses:
+                business_id = business.get('_id') or self.generate_business_id(business)
+
+                # Skip records an earlier checkpoint already appended
+                if '_id' in business and self.is_processed(business):
+                    continue
+
+                business['_id'] = business_id
+
+                # Dedup bookkeeping stays synchronous; only the disk write
+                # moves off the scrape loop
+                self.mark_processed(business_id)
+                batch.append(dict(business))
+
             self.last_checkpoint_count = count
-            self.checkpoint_file = checkpoint_file
-            self.logger.info(f"{Fore.GREEN}   Checkpoint saved: {os.path.basename(checkpoint_file)}")
-            
+            if batch:
+                self._writeq.put(batch)
+
         except Exception as e:
             self.logger.error(f"{Fore.RED}  ✗ Failed to save checkpoint: {e}")
+
+    def _writer_loop(self):
+        """Background thread that appends queued batches to the checkpoint"""
+        while True:
+            item = self._writeq.get()
+            try:
+                if item is None:
+                    break
+                if self._ckpt_fp is None:
+                    self._ckpt_fp = open(self.checkpoint_file, 'a',
+                                         encoding='utf-8', buffering=1 << 16)
+                # Timestamp at serialization time - keeps time.time() out
+                # of the per-card hot loop, one call per batch
+                stamp = time.time()
+                for business in item:
+                    business.setdefault('scraped_at', stamp)
+                    self._ckpt_fp.write(json_dumps(business) + '\n')
+                self._ckpt_fp.flush()
+                self.logger.info(
+                    f"{Fore.GREEN}   Checkpoint: +{len(item)} -> {os.path.basename(self.checkpoint_file)}"
+                )
+            except Exception as e:
+                self.logger.error(f"{Fore.RED}  ✗ Failed to save checkpoint: {e}")
+            finally:
+                self._writeq.task_done()
+
+    def flush_writes(self, fsync: bool = False):
+        """Block until all queued batches are on disk; fsync once if asked"""
+        self._writeq.join()
+
+        if fsync and self._ckpt_fp is not None:
+            try:
+                self._ckpt_fp.flush()
+                os.fsync(self._ckpt_fp.fileno())
+            except Exception as e:
+                self.logger.debug(f"fsync skipped: {e}")
     
     def convert_to_final(self):
         """Convert checkpoint to final formats"""
+        # Drain the writer queue and fsync once, instead of per batch
+        self.flush_writes(fsync=True)
+
         if not self.checkpoint_file or not os.path.exists(self.checkpoint_file):
             self.logger.warning("No checkpoint file to convert")
             return
@@ -204,7 +422,7 @@ class CheckpointManager:
             with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
                 for line in f:
                     if line.strip():
-                        businesses.append(json.loads(line))
+                        businesses.append(json_loads(line))
         except Exception as e:
             self.logger.error(f"Failed to read checkpoint: {e}")
             return
@@ -215,12 +433,21 @@ class CheckpointManager:
         
         self.logger.info(f"Loaded {len(businesses)} businesses from checkpoint")
         
-        # Save to final formats
-        self.save_to_csv(businesses)
-        self.save_to_excel(businesses)
-        self.save_to_json(businesses)
-        self.generate_html_report(businesses)
-        self.generate_summary(businesses)
+        # Save to final formats - independent exports, overlapped so the
+        # wall clock is bounded by the slowest format rather than the sum
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            futures = [
+                executor.submit(self.save_to_csv, businesses),
+                executor.submit(self.save_to_excel, businesses),
+                executor.submit(self.save_to_json, businesses),
+                executor.submit(self.save_to_parquet, businesses),
+                executor.submit(self.generate_html_report, businesses),
+                executor.submit(self.generate_summary, businesses),
+            ]
+            for future in futures:
+                future.result()
     
     def save_to_csv(self, businesses: List[Dict]):
         """Save to CSV"""
@@ -234,7 +461,7 @@ class CheckpointManager:
                     flat_b = {}
                     for key, value in b.items():
                         if isinstance(value, (dict, list)):
-                            flat_b[key] = json.dumps(value, ensure_ascii=False)
+                            flat_b[key] = json_dumps(value)
                         else:
                             flat_b[key] = value
                     flat_businesses.append(flat_b)
@@ -246,13 +473,37 @@ class CheckpointManager:
             self.logger.error(f"CSV export failed: {e}")
     
     def save_to_excel(self, businesses: List[Dict]):
-        """Save to Excel"""
+        """Save to Excel (streamed row-by-row, no DataFrame buffering)"""
         filename = os.path.join(self.final_dir, 'excel', f'{self.base_name}_{self.timestamp}.xlsx')
-        
+
         try:
             if businesses:
-                df = pd.DataFrame(businesses)
-                df.to_excel(filename, index=False)
+                from openpyxl import Workbook
+
+                # Union of keys across all businesses, in first-seen order
+                header = []
+                seen = set()
+                for b in businesses:
+                    for key in b:
+                        if key not in seen:
+                            seen.add(key)
+                            header.append(key)
+
+                # write_only mode streams each row straight to disk
+                wb = Workbook(write_only=True)
+                ws = wb.create_sheet('Businesses')
+                ws.append(header)
+
+                for b in businesses:
+                    row = []
+                    for key in header:
+                        value = b.get(key)
+                        if isinstance(value, (dict, list)):
+                            value = json_dumps(value)
+                        row.append(value)
+                    ws.append(row)
+
+                wb.save(filename)
                 self.logger.info(f"{Fore.GREEN}  ✓ Excel: {os.path.basename(filename)}")
         except Exception as e:
             self.logger.error(f"Excel export failed: {e}")
@@ -262,12 +513,41 @@ class CheckpointManager:
         filename = os.path.join(self.final_dir, 'json', f'{self.base_name}_{self.timestamp}.json')
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(businesses, f, indent=2, ensure_ascii=False, default=str)
+            if orjson is not None:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(businesses, option=orjson.OPT_INDENT_2, default=str))
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(businesses, f, indent=2, ensure_ascii=False, default=str)
             self.logger.info(f"{Fore.GREEN}  ✓ JSON: {os.path.basename(filename)}")
         except Exception as e:
             self.logger.error(f"JSON export failed: {e}")
     
+    def save_to_parquet(self, businesses: List[Dict]):
+        """Save to Parquet (optional columnar output for analytics)"""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            self.logger.debug("pyarrow not installed - skipping Parquet export")
+            return
+
+        filename = os.path.join(self.final_dir, 'parquet', f'{self.base_name}_{self.timestamp}.parquet')
+
+        try:
+            if businesses:
+                # Nested values are stored as JSON strings, like the CSV path
+                rows = [
+                    {key: (json_dumps(value) if isinstance(value, (dict, list)) else value)
+                     for key, value in b.items()}
+                    for b in businesses
+                ]
+                table = pa.Table.from_pylist(rows)
+                pq.write_table(table, filename, compression='zstd', use_dictionary=True)
+                self.logger.info(f"{Fore.GREEN}  ✓ Parquet: {os.path.basename(filename)}")
+        except Exception as e:
+            self.logger.error(f"Parquet export failed: {e}")
+
     def generate_html_report(self, businesses: List[Dict]):
         """Generate HTML report"""
         filename = os.path.join(self.final_dir, 'html', f'report_{self.base_name}_{self.timestamp}.html')
@@ -392,6 +672,50 @@ FIRST 10 BUSINESSES
             self.logger.error(f"Summary export failed: {e}")
 
 
+# ============================================================================
+# PARALLEL DETAIL EXTRACTION WORKERS
+# ============================================================================
+
+# One warm browser per worker process (Selenium doesn't multithread well,
+# so workers are processes that each own a browser)
+_worker_browser = None
+
+def _close_detail_worker():
+    """atexit hook - shut the worker's browser down with the process"""
+    global _worker_browser
+    if _worker_browser is not None:
+        try:
+            _worker_browser.close_browser()
+        except Exception:
+            pass
+        _worker_browser = None
+
+def _init_detail_worker(config: Dict):
+    """Pool initializer - start one browser per worker and keep it warm"""
+    global _worker_browser
+    _worker_browser = EnhancedBrowserManager(config)
+    _worker_browser.start_browser()
+    # Without this, pool shutdown would leave one orphaned
+    # Chrome/chromedriver pair per worker (runs on normal worker exit;
+    # parallel_scrape uses close()/join() rather than terminate() so
+    # workers do exit normally)
+    atexit.register(_close_detail_worker)
+
+def _extract_details_worker(place_url: str) -> Optional[Dict]:
+    """Navigate the worker's browser to a place URL and extract details"""
+    try:
+        _worker_browser.driver.get(place_url)
+        try:
+            WebDriverWait(_worker_browser.driver, 5, poll_frequency=0.05).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'div[role="main"] h1'))
+            )
+        except TimeoutException:
+            pass
+        return _worker_browser.extract_business_details()
+    except Exception:
+        return None
+
+
 # ============================================================================
 # MAIN SCRAPER
 # ============================================================================
@@ -412,12 +736,22 @@ class GoogleMapsScraperPro:
         
         # Initialize rate limiter
         self.rate_limiter = RateLimiter(min_delay=2, max_delay=5, jitter=True)
+
+        # Parallel detail-extraction workers (1 = classic in-page loop)
+        self.workers = self.config.get('advanced_settings', {}).get('workers', 1)
+
+        # In-memory duplicate keys - consulted before the checkpoint's
+        # md5-hashing check, one tuple hash per card
+        self._seen_keys = set()
+
+        # Pre-bound per-card string transform (bind once, invoke many)
+        self._name_from_text = operator.methodcaller('partition', '\n')
         
     def load_config(self):
         """Load configuration"""
         try:
-            with open(self.config_file, 'r') as f:
-                self.config = json.load(f)
+            with open(self.config_file, 'rb') as f:
+                self.config = json_loads(f.read())
             print(f"{Fore.GREEN}✓ Configuration loaded")
         except:
             self.config = {
@@ -428,19 +762,30 @@ class GoogleMapsScraperPro:
             }
     
     def setup_logging(self):
-        """Setup logging"""
+        """Setup logging - records go through a queue so the card loop
+        never blocks on file/console writes"""
+        from logging.handlers import QueueHandler, QueueListener
+
+        os.makedirs('output1/logs', exist_ok=True)
         log_file = os.path.join('output1/logs', f'scraper_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler()
-            ]
-        )
+
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(formatter)
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+
+        log_queue = Queue(-1)
+        root = logging.getLogger()
+        root.setLevel(logging.INFO)
+        root.handlers = [QueueHandler(log_queue)]
+
+        self._log_listener = QueueListener(log_queue, file_handler, stream_handler)
+        self._log_listener.start()
+
         self.logger = logging.getLogger(__name__)
         self.logger.info(f" Logging to: {log_file}")
-    
+
     def setup_signal_handlers(self):
         """Setup signal handlers for graceful Ctrl+C behavior"""
         def signal_handler(signum, frame):
@@ -451,15 +796,18 @@ class GoogleMapsScraperPro:
                 print(f"\n{Fore.YELLOW}⚠ First Ctrl+C detected: Skipping current item and continuing...")
                 print(f"{Fore.YELLOW}   Press Ctrl+C again within 2 seconds to force exit")
                 self.interrupted = True
-                
-                # Set a timer for second Ctrl+C
-                def reset_interrupt():
-                    time.sleep(2)
-                    self.interrupt_count = 0
-                    self.interrupted = False
-                
-                threading.Thread(target=reset_interrupt, daemon=True).start()
-                
+
+                # Arm the 2s reset window - a kernel one-shot timer on
+                # POSIX, a throwaway thread only on platforms without it
+                if hasattr(signal, 'setitimer'):
+                    signal.setitimer(signal.ITIMER_REAL, 2.0)
+                else:
+                    def reset_interrupt():
+                        time.sleep(2)
+                        self._reset_interrupt()
+
+                    threading.Thread(target=reset_interrupt, daemon=True).start()
+
             elif self.interrupt_count == 2:
                 # Second Ctrl+C within 2 seconds - Force exit
                 print(f"\n{Fore.RED}⚠ Second Ctrl+C detected: Forcing immediate exit!")
@@ -472,41 +820,32 @@ class GoogleMapsScraperPro:
                 
                 sys.exit(1)
         
+        def alarm_handler(signum, frame):
+            self._reset_interrupt()
+
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
+        if hasattr(signal, 'SIGALRM'):
+            signal.signal(signal.SIGALRM, alarm_handler)
+
+    def _reset_interrupt(self):
+        """Clear the Ctrl+C double-press window"""
+        self.interrupt_count = 0
+        self.interrupted = False
     
+    @staticmethod
+    def _business_key(business: Dict) -> tuple:
+        """Cheap in-memory dedup key (matches generate_business_id inputs)"""
+        return (business.get('name', ''), business.get('phone') or '',
+                business.get('address') or '')
+
     def extract_phone_from_text(self, text: str) -> Optional[str]:
         """Extract phone number from text"""
-        # Common phone patterns
-        patterns = [
-            r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-            r'(\+?\d{1,3}[-.\s]?)?\d{10}',
-            r'(\+?\d{1,3}[-.\s]?)?\d{3}[-.\s]?\d{3}[-.\s]?\d{4}'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if match:
-                return match.group(0)
-        return None
-    
+        return extract_phone(text)
+
     def extract_rating_from_text(self, text: str) -> Optional[float]:
         """Extract rating from text"""
-        # Look for patterns like "4.5" or "4,5"
-        patterns = [
-            r'(\d+\.\d+)',
-            r'(\d+,\d+)'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                # Usually the first number is the rating
-                try:
-                    return float(matches[0].replace(',', '.'))
-                except:
-                    pass
-        return None
+        return extract_rating(text)
     
     def manual_mode(self, max_results: int = 500):
         """
@@ -521,8 +860,12 @@ class GoogleMapsScraperPro:
         print(f"{Fore.CYAN}4. Return here and press Enter")
         print(f"{Fore.MAGENTA}{'='*60}\n")
         
-        # Initialize browser
-        browser = EnhancedBrowserManager(self.config)
+        # Initialize browser (Playwright engine is opt-in via --engine)
+        if self.config.get('advanced_settings', {}).get('engine') == 'playwright':
+            from core.playwright_browser import PlaywrightBrowserManager
+            browser = PlaywrightBrowserManager(self.config)
+        else:
+            browser = EnhancedBrowserManager(self.config)
         
         try:
             browser.start_browser()
@@ -537,8 +880,8 @@ class GoogleMapsScraperPro:
             # Give a moment for results to settle
             time.sleep(2)
             
-            # Check for business cards
-            cards = browser.get_business_cards()
+            # Check for business cards (one JS round-trip for the list)
+            cards = browser.get_business_card_snapshots()
             self.logger.info(f" Found {len(cards)} business cards")
             
             if len(cards) == 0:
@@ -556,18 +899,32 @@ class GoogleMapsScraperPro:
             
             # Initialize checkpoint
             base_name = f"manual_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            self.checkpoint = CheckpointManager(base_name)
+            self.checkpoint = CheckpointManager(
+                base_name,
+                exact_dedup=self.config.get('advanced_settings', {}).get('exact_dedup', False)
+            )
             
             self.start_time = time.time()
             self.businesses = []
-            
+
             print(f"\n{Fore.MAGENTA}{'='*60}")
             print(f"{Fore.MAGENTA} STARTING SCRAPE")
             print(f"{Fore.MAGENTA}{'='*60}")
-            
-            # Create parser with driver
-            parser = SmartParser(browser.driver)
-            self.logger.info(" SmartParser initialized with driver")
+
+            # Parallel path: if cards expose place URLs, fan the detail
+            # extraction out to a pool of worker browsers. Hrefs are
+            # collected with a scroll loop first - the initial snapshot
+            # only covers one screenful (~50 cards)
+            if self.workers > 1:
+                place_urls = self._collect_place_urls(browser, max_results)
+                if place_urls:
+                    self.parallel_scrape(place_urls, max_results)
+                    if self.businesses:
+                        self.checkpoint.save_checkpoint(self.businesses, len(self.businesses))
+                        self.checkpoint.convert_to_final()
+                    self.show_summary()
+                    return
+                self.logger.info("No place URLs on cards - falling back to in-page loop")
             
             # Progress bar
             pbar = tqdm(total=max_results, desc="Scraping", unit="businesses")
@@ -591,9 +948,10 @@ class GoogleMapsScraperPro:
                 if len(self.businesses) > 0 and len(self.businesses) % 20 == 0:
                     self.rate_limiter.long_break()
                 
-                # Get current cards (refresh to avoid stale)
+                # Get current card snapshots - index/text/name for every
+                # visible card in a single JS call, no per-card .text reads
                 try:
-                    current_cards = browser.get_business_cards()
+                    current_cards = browser.get_business_card_snapshots()
                 except Exception as e:
                     self.logger.error(f"Error getting cards: {e}")
                     time.sleep(2)
@@ -603,12 +961,14 @@ class GoogleMapsScraperPro:
                     self.logger.info("No more cards available")
                     break
                 
-                # Find new cards to process (skip already processed AND failed)
-                new_indices = []
-                for i in range(min(len(current_cards), max_results)):
-                    if i not in processed_indices and i not in failed_cards:
-                        new_indices.append(i)
-                
+                # Find new cards to process (skip already processed AND
+                # failed) - one C-level set difference per outer cycle
+                # instead of per-index membership tests
+                new_indices = sorted(
+                    set(range(min(len(current_cards), max_results)))
+                    - processed_indices - failed_cards
+                )
+
                 if not new_indices:
                     stagnant_count += 1
                     time.sleep(1)
@@ -628,35 +988,32 @@ class GoogleMapsScraperPro:
                         continue
                     
                     try:
-                        card = current_cards[idx]
-                        
-                        # Scroll into view
-                        try:
-                            browser.driver.execute_script(
-                                "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});",
-                                card
-                            )
-                            time.sleep(0.5)
-                        except:
-                            pass
-                        
-                        # Click on card
-                        if not browser.safe_click(card):
+                        snapshot = current_cards[idx]
+
+                        # Click on card by index (the JS scrolls it into
+                        # view and clicks in the same round-trip)
+                        if not browser.click_card_by_index(idx):
                             failed_cards.add(idx)
                             continue
-                        
-                        time.sleep(1)
-                        
-                        # Get card text for extraction
-                        card_text = card.text
-                        
-                        # Extract name using SmartParser
+
+                        # Poll for the detail panel instead of a fixed 1s
+                        # sleep - typically ready in 200-600ms
                         try:
-                            name = parser.extract_name(card)
-                        except:
-                            # Fallback: try to extract from card text
-                            lines = card_text.split('\n')
-                            name = lines[0] if lines else None
+                            WebDriverWait(browser.driver, 3, poll_frequency=0.05).until(
+                                EC.presence_of_element_located(
+                                    (By.CSS_SELECTOR, 'div[role="main"] h1')
+                                )
+                            )
+                        except TimeoutException:
+                            pass
+
+                        # Text and name come from the batched snapshot
+                        card_text = snapshot.get('text', '')
+                        name = snapshot.get('name')
+                        if not name:
+                            # Fallback: first line of the card text,
+                            # without materializing every line
+                            name = self._name_from_text(card_text)[0] or None
                         
                         if name:
                             # Create business dict
@@ -668,60 +1025,49 @@ class GoogleMapsScraperPro:
                                 'rating': self.extract_rating_from_text(card_text),
                                 'reviews': None,
                                 'category': None,
-                                'scraped_at': time.time(),
                                 'mode': 'manual'
                             }
                             
                             # Try to get more details from the page after click
+                            # (single JS round-trip for all four fields)
                             try:
-                                # Look for phone in the detail view
-                                phone_elements = browser.driver.find_elements(By.CSS_SELECTOR, 'button[data-item-id*="phone"], a[href^="tel:"]')
-                                if phone_elements:
-                                    business['phone'] = phone_elements[0].text or phone_elements[0].get_attribute('href', '').replace('tel:', '')
-                                
-                                # Look for website
-                                website_elements = browser.driver.find_elements(By.CSS_SELECTOR, 'a[data-item-id*="authority"], a[href^="http"]')
-                                for elem in website_elements:
-                                    href = elem.get_attribute('href')
-                                    if href and 'google.com' not in href and href.startswith('http'):
-                                        business['website'] = href
-                                        break
-                                
-                                # Look for address
-                                address_elements = browser.driver.find_elements(By.CSS_SELECTOR, 'button[data-item-id*="address"]')
-                                if address_elements:
-                                    business['address'] = address_elements[0].text
-                                
-                                # Look for category
-                                category_elements = browser.driver.find_elements(By.CSS_SELECTOR, 'button[jsaction*="category"]')
-                                if category_elements:
-                                    business['category'] = category_elements[0].text
-                                    
+                                details = browser.driver.execute_script(_DETAIL_EXTRACT_JS)
+                                if details:
+                                    for key in ('phone', 'website', 'address', 'category'):
+                                        if details.get(key):
+                                            business[key] = details[key]
                             except:
-                                pass
+                                # JS blocked? One XPath union call still
+                                # beats four per-selector queries
+                                try:
+                                    for element in browser.driver.find_elements(By.XPATH, _DETAIL_XPATH):
+                                        _apply_detail_element(element, business)
+                                except:
+                                    pass
                             
-                            # Check for duplicate
-                            if not self.checkpoint.is_processed(business):
+                            # Check for duplicate - cheap key-tuple lookup
+                            # first, checkpoint hash check second
+                            key = self._business_key(business)
+                            if key not in self._seen_keys and not self.checkpoint.is_processed(business):
+                                self._seen_keys.add(key)
                                 self.businesses.append(business)
                                 processed_indices.add(idx)
                                 pbar.update(1)
                                 
                                 # Show success
+                                n = len(self.businesses)
                                 name_short = business['name'][:40] + "..." if len(business['name']) > 40 else business['name']
-                                icons = []
-                                if business.get('phone'): icons.append("📞")
-                                if business.get('website'): icons.append("🌐")
-                                if business.get('address'): icons.append("📍")
-                                if business.get('rating'): icons.append("⭐")
-                                print(f"\n{Fore.GREEN}    #{len(self.businesses)}: {name_short} {' '.join(icons)}")
-                                
-                                # Save checkpoint every 10 businesses
-                                if len(self.businesses) % 10 == 0:
+                                icons = ' '.join(icon for key, icon in _ICON_MAP if business.get(key))
+                                print(f"\n{Fore.GREEN}    #{n}: {name_short} {icons}")
+
+                                # Queue a checkpoint batch every 25
+                                # businesses - the background writer does
+                                # the disk I/O, so the loop never blocks
+                                if n % 25 == 0:
                                     self.checkpoint.save_checkpoint(
-                                        self.businesses[-10:],
-                                        len(self.businesses)
+                                        self.businesses[-25:], n
                                     )
-                                    print(f"{Fore.CYAN} Progress: {len(self.businesses)} businesses scraped")
+                                    print(f"{Fore.CYAN} Progress: {n} businesses scraped")
                                     
                                     # Reset rate limiter after checkpoint
                                     self.rate_limiter.reset()
@@ -741,8 +1087,13 @@ class GoogleMapsScraperPro:
                         failed_cards.add(idx)
                         continue
                     
-                    # Small pause between cards (already handled by rate limiter)
-                    pass
+                    # Advance the feed every 5 cards so new results
+                    # lazy-load - one scroll round-trip amortized over 5
+                    if idx % 5 == 4:
+                        try:
+                            browser.driver.execute_script(_FEED_SCROLL_JS)
+                        except:
+                            pass
             
             pbar.close()
             
@@ -760,7 +1111,92 @@ class GoogleMapsScraperPro:
             traceback.print_exc()
         finally:
             browser.close_browser()
+            if getattr(self, '_log_listener', None):
+                self._log_listener.stop()
+                self._log_listener = None
     
+    def _collect_place_urls(self, browser, max_results: int) -> List[str]:
+        """Scroll the results feed collecting card hrefs.
+
+        The card snapshot only sees the rendered cards (capped at 50),
+        and the feed lazy-loads more on scroll - so the parallel path
+        walks the feed the same way the in-page loop does, stopping at
+        max_results or when the feed stops yielding new cards.
+        """
+        urls = []
+        seen = set()
+        stagnant = 0
+
+        while len(urls) < max_results and stagnant < 10:
+            before = len(seen)
+            for snapshot in browser.get_business_card_snapshots():
+                href = snapshot.get('href')
+                if href and href not in seen:
+                    seen.add(href)
+                    urls.append(href)
+                    if len(urls) >= max_results:
+                        break
+
+            if len(urls) >= max_results:
+                break
+            stagnant = stagnant + 1 if len(seen) == before else 0
+
+            try:
+                browser.driver.execute_script(_FEED_SCROLL_JS)
+            except Exception:
+                pass
+            time.sleep(0.5)
+
+        return urls
+
+    def parallel_scrape(self, place_urls: List[str], max_results: int):
+        """Extract place details with a pool of worker browser processes"""
+        import multiprocessing
+
+        workers = max(1, min(self.workers, len(place_urls)))
+        self.logger.info(f" Parallel extraction with {workers} browser workers")
+
+        pbar = tqdm(total=min(len(place_urls), max_results), desc="Scraping", unit="businesses")
+
+        pool = multiprocessing.Pool(workers, initializer=_init_detail_worker,
+                                    initargs=(self.config,))
+        try:
+            for business in pool.imap_unordered(_extract_details_worker, place_urls):
+                if self.interrupted:
+                    self.interrupted = False
+                    break
+
+                if not business or not business.get('name'):
+                    continue
+
+                business['mode'] = 'manual'
+                key = self._business_key(business)
+                if key in self._seen_keys or self.checkpoint.is_processed(business):
+                    continue
+
+                self._seen_keys.add(key)
+                self.businesses.append(business)
+                pbar.update(1)
+
+                # Queue a checkpoint batch every 25 businesses
+                if len(self.businesses) % 25 == 0:
+                    self.checkpoint.save_checkpoint(
+                        self.businesses[-25:],
+                        len(self.businesses)
+                    )
+
+                if len(self.businesses) >= max_results:
+                    break
+        except Exception as e:
+            self.logger.error(f"Parallel extraction failed: {e}")
+        finally:
+            # close()/join(), not terminate(): SIGTERM would kill the
+            # workers before their atexit browser cleanup runs and
+            # orphan one Chrome per worker
+            pool.close()
+            pool.join()
+            pbar.close()
+
     def show_summary(self):
         """Show summary of scraping"""
         if not self.start_time or not self.businesses:
@@ -816,12 +1252,18 @@ def main():
     parser.add_argument('--location', '-l', help='Location (for auto mode)')
     parser.add_argument('--max', '-m', type=int, default=500, help='Max results')
     parser.add_argument('--headless', action='store_true', help='Run headless')
+    parser.add_argument('--workers', '-w', type=int, default=1,
+                       help='Parallel browser workers for detail extraction')
+    parser.add_argument('--engine', choices=['selenium', 'playwright'], default='selenium',
+                       help='Browser automation engine')
     
     # Rate limiting options
     parser.add_argument('--delay', type=float, default=2.0, 
                        help='Minimum delay between requests (seconds)')
     parser.add_argument('--no-jitter', action='store_true',
                        help='Disable random jitter (not recommended)')
+    parser.add_argument('--exact-dedup', action='store_true',
+                       help='Use an exact id set for dedup instead of a bloom filter (more RAM)')
     
     args = parser.parse_args()
     
@@ -834,6 +1276,9 @@ def main():
     config = {
         "advanced_settings": {
             "headless": args.headless,
+            "exact_dedup": args.exact_dedup,
+            "workers": args.workers,
+            "engine": args.engine,
             "rate_limiting": {
                 "min_delay": args.delay,
                 "max_delay": args.delay * 2.5,
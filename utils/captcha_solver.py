@@ -4,7 +4,9 @@ Supports multiple captcha types and solving services
 """
 
 import re
+import sys
 import time
+import asyncio
 import logging
 import base64
 import json
@@ -21,13 +23,131 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import cv2
 import pytesseract
 from urllib.parse import urlparse, parse_qs
+from collections import OrderedDict
 import hashlib
 from datetime import datetime
 import os
 
+try:
+    import ahocorasick  # pyahocorasick - optional, multi-literal matching
+except ImportError:
+    ahocorasick = None
+
+try:
+    import aiohttp  # optional - concurrent provider races
+except ImportError:
+    aiohttp = None
+
+try:
+    import hyperscan  # optional - SIMD-accelerated multi-pattern scanner
+except ImportError:
+    hyperscan = None
+
+try:
+    import tesserocr  # optional - in-process Tesseract API, no per-call fork
+except ImportError:
+    tesserocr = None
+
+try:
+    from cachetools import TTLCache, LRUCache  # optional - bounded caches
+except ImportError:
+    TTLCache = None
+    LRUCache = None
+
+# Text-captcha answer tables, compiled once at import instead of being
+# rebuilt (and re-matched through the re cache) on every call.
+# Arithmetic questions share a single pattern with an operator dispatch
+# table - one scan covers every operator and phrasing.
+_MATH_RE = re.compile(r'(\d+)\s*([+\-*/x×])\s*(\d+)')
+_MATH_OPS = {
+    '+': lambda a, b: a + b,
+    '-': lambda a, b: a - b,
+    '*': lambda a, b: a * b,
+    'x': lambda a, b: a * b,
+    '×': lambda a, b: a * b,
+    '/': lambda a, b: a // b,
+}
+
+# Preprocessing kernels, built once: the 1-D Gaussian pair lets the blur
+# run as two separable passes (6 multiplies/pixel instead of 9)
+_GAUSS_KERNEL = cv2.getGaussianKernel(3, 0)
+_MORPH_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))
+
+def _perceptual_hash(image_data: bytes) -> Optional[int]:
+    """64-bit dHash of an image.
+
+    Robust to re-encoding and minor noise, so the same captcha served
+    twice hashes identically even if the bytes differ.
+    """
+    try:
+        image = Image.open(BytesIO(image_data)).convert('L')
+        small = cv2.resize(np.asarray(image), (9, 8), interpolation=cv2.INTER_AREA)
+        bits = small[:, 1:] > small[:, :-1]
+        return int.from_bytes(np.packbits(bits).tobytes(), 'big')
+    except Exception:
+        return None
+
+# OCR answer validation via byte translation tables - deleting the
+# allowed alphabet leaves b'' for a clean answer, so the whole check is
+# C-side with no Python-level character loop
+_OCR_WS = b' \t\n\r'
+_OCR_ALLOWED = b'0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+def _clean_ocr_text(text: str) -> Optional[str]:
+    """Normalize OCR output and accept only 4-8 char alphanumeric answers"""
+    cleaned = text.encode('ascii', 'ignore').translate(None, _OCR_WS).upper()
+    if 4 <= len(cleaned) <= 8 and not cleaned.translate(None, _OCR_ALLOWED):
+        return cleaned.decode('ascii')
+    return None
+
+# Word questions: a None answer means "return the captured group",
+# anything else is a fixed interned answer - no per-match function call
+_WORD_PATTERNS = (
+    (re.compile(r'type the word ["\']?(\w+)["\']?', re.IGNORECASE), None),
+    (re.compile(r'enter the text:?\s*["\']?(\w+)["\']?', re.IGNORECASE), None),
+    (re.compile(r'what color is the sky', re.IGNORECASE), sys.intern('blue')),
+    (re.compile(r'what color is grass', re.IGNORECASE), sys.intern('green')),
+    (re.compile(r'what is the capital of france', re.IGNORECASE), sys.intern('paris')),
+    (re.compile(r'what is the capital of usa', re.IGNORECASE), sys.intern('washington')),
+)
+
 class CaptchaDetector:
     """Detects various types of captchas on web pages"""
-    
+
+    # Site key extraction - one combined alternation per type so a single
+    # search replaces the sequential per-pattern scan
+    _SITE_KEY_SOURCES = {
+        'recaptcha_v2': [
+            r'data-sitekey=["\']([^"\']+)["\']',
+            r'[?&]k=([^&"\']+)',
+            r'sitekey=([^&\s"\']+)'
+        ],
+        'recaptcha_v3': [
+            r'render=["\']([^"\']+)["\']',
+            r'sitekey=([^&\s"\']+)'
+        ],
+        'hcaptcha': [
+            r'data-sitekey=["\']([^"\']+)["\']',
+            r'sitekey=([^&\s"\']+)'
+        ],
+        'funcaptcha': [
+            r'data-pkey=["\']([^"\']+)["\']',
+            r'public_key=([^&\s"\']+)'
+        ],
+        'geetest': [
+            r'gt=([^&\s"\']+)',
+            r'challenge=([^&\s"\']+)'
+        ],
+        'turnstile': [
+            r'data-sitekey=["\']([^"\']+)["\']',
+            r'sitekey=([^&\s"\']+)'
+        ]
+    }
+    _SITE_KEY_PATTERNS = {
+        captcha_type: re.compile('|'.join(patterns))
+        for captcha_type, patterns in _SITE_KEY_SOURCES.items()
+    }
+
     def __init__(self, driver=None):
         self.driver = driver
         self.logger = logging.getLogger(__name__)
@@ -131,7 +251,78 @@ class CaptchaDetector:
                 'iframe[src*="turnstile"]'
             ]
         }
-        
+
+        # One compound CSS query per type - a single WebDriver round-trip
+        # replaces up to four sequential lookups
+        self._joined_selectors = {
+            captcha_type: ", ".join(selectors)
+            for captcha_type, selectors in self.captcha_selectors.items()
+        }
+
+        # Pre-lowered literals for the pure-Python fallback tier. Each
+        # is tested with a C-level substring check, which reports
+        # overlapping literals ('cf-turnstile' also contains
+        # 'turnstile') exactly like the ahocorasick and hyperscan tiers
+        # do - a merged-alternation finditer would consume overlaps and
+        # undercount confidence depending on the installed engine.
+        self._lowered_patterns = [
+            (captcha_type, pattern, pattern.lower())
+            for captcha_type, patterns in self.captcha_patterns.items()
+            for pattern in patterns
+        ]
+        self._pattern_totals = {
+            captcha_type: len(patterns)
+            for captcha_type, patterns in self.captcha_patterns.items()
+        }
+
+        # Aho-Corasick automaton over the same literals - a single trie
+        # walk beats even a merged regex for pure substring matching
+        self._automaton = None
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for captcha_type, patterns in self.captcha_patterns.items():
+                for pattern in patterns:
+                    automaton.add_word(pattern.lower(), (captcha_type, pattern))
+            automaton.make_automaton()
+            self._automaton = automaton
+
+        # Hyperscan database over the same literals - vectorised scanning,
+        # the fastest tier when the wheel is available. SINGLEMATCH caps
+        # each pattern at one report, matching the distinct-hit tally.
+        self._hs_db = None
+        self._hs_scratch = None
+        self._hs_ids = []
+        if hyperscan is not None:
+            try:
+                expressions = []
+                for captcha_type, patterns in self.captcha_patterns.items():
+                    for pattern in patterns:
+                        self._hs_ids.append((captcha_type, pattern))
+                        expressions.append(re.escape(pattern.lower()).encode())
+                db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+                db.compile(
+                    expressions=expressions,
+                    ids=list(range(len(expressions))),
+                    flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(expressions)
+                )
+                self._hs_db = db
+                self._hs_scratch = hyperscan.Scratch(db)
+            except Exception as e:
+                self.logger.debug(f"Hyperscan database unavailable: {str(e)}")
+                self._hs_db = None
+
+        # Scan results keyed by (url, page_source) hash - polling loops
+        # re-detect the same DOM many times in a row
+        self._detect_cache = OrderedDict()
+        self._detect_cache_size = 64
+
+        # Image fetches: keep-alive session plus a small ETag-aware cache
+        # so an unchanged captcha image is not downloaded twice
+        self._img_sess = requests.Session()
+        self._img_etag = {}
+        self._img_cache = OrderedDict()
+        self._img_cache_size = 32
+
     def detect(self, page_source: str = None, driver=None) -> Dict[str, Any]:
         """Detect captcha type and details from page"""
         if driver:
@@ -153,29 +344,74 @@ class CaptchaDetector:
         elif not page_source:
             return result
         
-        # Check each captcha type
-        for captcha_type, patterns in self.captcha_patterns.items():
-            confidence = 0
-            matched_patterns = []
-            
-            for pattern in patterns:
-                if re.search(pattern, page_source, re.IGNORECASE):
-                    confidence += 1
-                    matched_patterns.append(pattern)
-            
-            if confidence > 0:
-                confidence_score = (confidence / len(patterns)) * 100
-                
+        # Memoize the scan on a fast page hash - polling loops re-detect
+        # the same DOM many times in a row. The URL is part of the key so
+        # navigation invalidates stale entries with identical markup.
+        current_url = self.driver.current_url if self.driver else ''
+        cache_key = hashlib.blake2b(
+            (current_url + page_source).encode('utf-8', 'ignore'),
+            digest_size=8
+        ).digest()
+
+        cached = self._detect_cache.get(cache_key)
+        if cached is not None:
+            self._detect_cache.move_to_end(cache_key)
+            result.update(cached)
+            result['details'] = dict(cached['details'])
+        else:
+            # Single pass over the page, tallying distinct pattern hits per
+            # type. Once a type has matched all of its patterns it sits at
+            # 100% confidence and nothing can beat it - stop scanning.
+            # Lowercase the page once - case-insensitive matching would
+            # otherwise fold every character inside the engine
+            hay = page_source.lower()
+            matched = {}
+            totals = self._pattern_totals
+            if self._hs_db is not None:
+                hit_ids = []
+                self._hs_db.scan(
+                    hay.encode('utf-8', 'ignore'),
+                    match_event_handler=lambda pid, start, end, flags, ctx: hit_ids.append(pid),
+                    scratch=self._hs_scratch
+                )
+                for pid in hit_ids:
+                    captcha_type, pattern = self._hs_ids[pid]
+                    matched.setdefault(captcha_type, set()).add(pattern)
+            elif self._automaton is not None:
+                for _, (captcha_type, pattern) in self._automaton.iter(hay):
+                    hits = matched.setdefault(captcha_type, set())
+                    hits.add(pattern)
+                    if len(hits) == totals[captcha_type]:
+                        break
+            else:
+                for captcha_type, pattern, lowered in self._lowered_patterns:
+                    if lowered in hay:
+                        matched.setdefault(captcha_type, set()).add(pattern)
+
+            for captcha_type, hits in matched.items():
+                confidence_score = (len(hits) / len(self.captcha_patterns[captcha_type])) * 100
+
                 if confidence_score > result['confidence']:
                     result['detected'] = True
                     result['captcha_type'] = captcha_type
                     result['confidence'] = confidence_score
-                    result['details']['patterns'] = matched_patterns
-                    
+                    result['details']['patterns'] = sorted(hits)
+
                     # Extract site key if available
                     site_key = self.extract_site_key(page_source, captcha_type)
                     if site_key:
                         result['site_key'] = site_key
+
+            # Element and driver state are resolved outside the cache
+            self._detect_cache[cache_key] = {
+                'detected': result['detected'],
+                'captcha_type': result['captcha_type'],
+                'site_key': result['site_key'],
+                'confidence': result['confidence'],
+                'details': dict(result['details'])
+            }
+            if len(self._detect_cache) > self._detect_cache_size:
+                self._detect_cache.popitem(last=False)
         
         # Try to find the actual element
         if result['detected'] and self.driver:
@@ -188,42 +424,16 @@ class CaptchaDetector:
     
     def extract_site_key(self, page_source: str, captcha_type: str) -> Optional[str]:
         """Extract site key from page source"""
-        
-        patterns = {
-            'recaptcha_v2': [
-                r'data-sitekey=["\']([^"\']+)["\']',
-                r'?k=([^&"\']+)',
-                r'sitekey=([^&\s"\']+)'
-            ],
-            'recaptcha_v3': [
-                r'render=["\']([^"\']+)["\']',
-                r'sitekey=([^&\s"\']+)'
-            ],
-            'hcaptcha': [
-                r'data-sitekey=["\']([^"\']+)["\']',
-                r'sitekey=([^&\s"\']+)'
-            ],
-            'funcaptcha': [
-                r'data-pkey=["\']([^"\']+)["\']',
-                r'public_key=([^&\s"\']+)'
-            ],
-            'geetest': [
-                r'gt=([^&\s"\']+)',
-                r'challenge=([^&\s"\']+)'
-            ],
-            'turnstile': [
-                r'data-sitekey=["\']([^"\']+)["\']',
-                r'sitekey=([^&\s"\']+)'
-            ]
-        }
-        
-        type_patterns = patterns.get(captcha_type, [])
-        
-        for pattern in type_patterns:
-            match = re.search(pattern, page_source)
-            if match:
-                return match.group(1)
-        
+
+        pattern = self._SITE_KEY_PATTERNS.get(captcha_type)
+        if not pattern:
+            return None
+
+        match = pattern.search(page_source)
+        if match:
+            # Whichever alternative matched carries the key
+            return next((group for group in match.groups() if group), None)
+
         return None
     
     def find_captcha_element(self, captcha_type: str) -> Optional[WebElement]:
@@ -231,16 +441,17 @@ class CaptchaDetector:
         if not self.driver:
             return None
         
-        selectors = self.captcha_selectors.get(captcha_type, [])
-        
-        for selector in selectors:
-            try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    return elements[0]
-            except:
-                continue
-        
+        selector = self._joined_selectors.get(captcha_type)
+        if not selector:
+            return None
+
+        try:
+            elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+            if elements:
+                return elements[0]
+        except:
+            pass
+
         return None
     
     def is_captcha_present(self) -> bool:
@@ -264,8 +475,26 @@ class CaptchaDetector:
             if element.tag_name == 'img':
                 img_url = element.get_attribute('src')
                 if img_url:
-                    response = requests.get(img_url, timeout=10)
+                    headers = {}
+                    etag = self._img_etag.get(img_url)
+                    if etag and img_url in self._img_cache:
+                        headers['If-None-Match'] = etag
+
+                    response = self._img_sess.get(img_url, headers=headers, timeout=10)
+
+                    if response.status_code == 304:
+                        # Unchanged since last fetch - serve the cached bytes
+                        self._img_cache.move_to_end(img_url)
+                        return self._img_cache[img_url]
+
                     if response.status_code == 200:
+                        etag = response.headers.get('ETag')
+                        if etag:
+                            self._img_etag[img_url] = etag
+                            self._img_cache[img_url] = response.content
+                            if len(self._img_cache) > self._img_cache_size:
+                                old_url, _ = self._img_cache.popitem(last=False)
+                                self._img_etag.pop(old_url, None)
                         return response.content
             
             # Fallback: take screenshot of element
@@ -293,19 +522,51 @@ class CaptchaSolver:
         self.default_timeout = self.config.get('solver_timeout', 120)
         self.polling_interval = self.config.get('polling_interval', 5)
         self.use_ocr = self.config.get('use_ocr', True)
+
+        # Shared HTTP session - keep-alive connection reuse avoids a
+        # TCP+TLS handshake on every submit/poll round-trip
+        self._sess = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=8, max_retries=1)
+        self._sess.mount('https://', adapter)
         
         # Initialize OCR if available
+        self._tess = None
         if self.use_ocr:
             try:
-                pytesseract.get_tesseract_version()
-                self.ocr_available = True
+                if tesserocr is not None:
+                    # Persistent in-process engine - avoids forking a
+                    # tesseract binary for every recognition attempt
+                    self._tess = tesserocr.PyTessBaseAPI(psm=tesserocr.PSM.SINGLE_WORD)
+                    self.ocr_available = True
+                else:
+                    pytesseract.get_tesseract_version()
+                    self.ocr_available = True
             except:
                 self.ocr_available = False
                 self.logger.warning("Tesseract OCR not installed. OCR captcha solving disabled.")
         
-        # Cache for solved captchas (avoid re-solving)
-        self.solution_cache = {}
+        # Cache for solved captchas (avoid re-solving). TTLCache evicts by
+        # both size and age; the fallback is a bounded OrderedDict whose
+        # entries carry their own timestamp.
         self.cache_ttl = 3600  # 1 hour
+        self._cache_max = self.config.get('cache_max', 1024)
+        if TTLCache is not None:
+            self.solution_cache = TTLCache(maxsize=self._cache_max, ttl=self.cache_ttl)
+        else:
+            self.solution_cache = OrderedDict()
+
+        # Image solutions keyed by perceptual hash - the same captcha
+        # image pool gets re-served constantly within a session
+        if LRUCache is not None:
+            self._img_sol_cache = LRUCache(maxsize=1024)
+        else:
+            self._img_sol_cache = OrderedDict()
+
+        # Preprocessed images keyed by a hash of the raw pixels - retries
+        # on the same page skip the five-op OpenCV pipeline
+        self._pre_cache = OrderedDict()
+        self._pre_cache_size = 128
         
     def solve(self, driver=None, captcha_type: str = None, **kwargs) -> Optional[str]:
         """Solve captcha - main entry point"""
@@ -325,11 +586,10 @@ class CaptchaSolver:
         
         # Check cache
         cache_key = self.get_cache_key(captcha_type, kwargs)
-        if cache_key in self.solution_cache:
-            cache_time, solution = self.solution_cache[cache_key]
-            if time.time() - cache_time < self.cache_ttl:
-                self.logger.info("Using cached captcha solution")
-                return solution
+        solution = self._cache_get(cache_key)
+        if solution:
+            self.logger.info("Using cached captcha solution")
+            return solution
         
         # Route to appropriate solver
         solvers = {
@@ -354,7 +614,7 @@ class CaptchaSolver:
             
             # Cache solution
             if solution:
-                self.solution_cache[cache_key] = (time.time(), solution)
+                self._cache_put(cache_key, solution)
             
             return solution
             
@@ -362,49 +622,198 @@ class CaptchaSolver:
             self.logger.error(f"Captcha solving failed: {str(e)}")
             return None
     
-    def solve_recaptcha_v2(self, site_key: str, url: str, **kwargs) -> Optional[str]:
-        """Solve reCAPTCHA v2"""
-        
-        # Try 2captcha first
-        if self.twocaptcha_key:
-            try:
-                # Create task
-                response = requests.post('https://2captcha.com/in.php', data={
+    def _twocaptcha_solve(self, submit_data: Dict) -> Optional[str]:
+        """Submit a task to 2captcha and poll for its result.
+
+        submit_data carries the method-specific fields; the API key and
+        json flag are filled in here so callers stay one-liners.
+        """
+        try:
+            response = self._sess.post(
+                'https://2captcha.com/in.php', timeout=10,
+                data=dict(submit_data, key=self.twocaptcha_key, json=1))
+
+            if response.status_code == 200:
+                data = response.json()
+                if data.get('status') == 1:
+                    return self._poll_2captcha(data['request'])
+
+        except Exception as e:
+            self.logger.error(f"2captcha error: {str(e)}")
+
+        return None
+
+    def _poll_2captcha(self, captcha_id: str) -> Optional[str]:
+        """Poll 2captcha for a submitted task's result.
+
+        Backs off from 1s up to the configured polling interval, so fast
+        solves (often 2-5s) return early without extra load on slow ones.
+        """
+        deadline = time.monotonic() + self.default_timeout
+        wait = 1.0
+
+        while time.monotonic() < deadline:
+            time.sleep(wait)
+            wait = min(wait * 1.5, self.polling_interval)
+
+            result = self._sess.get('https://2captcha.com/res.php', timeout=10, params={
+                'key': self.twocaptcha_key,
+                'action': 'get',
+                'id': captcha_id,
+                'json': 1
+            })
+
+            if result.status_code != 200:
+                continue
+
+            data = result.json()
+            if data.get('status') == 1:
+                return data['request']
+            if data.get('request') != 'CAPCHA_NOT_READY':
+                return None
+
+        return None
+
+    async def _poll_2captcha_async(self, session, submit_data: Dict) -> Optional[str]:
+        """Submit a task to 2captcha and poll for the solution (coroutine)"""
+        async with session.post('https://2captcha.com/in.php', data=submit_data) as response:
+            data = await response.json()
+
+        if data.get('status') != 1:
+            return None
+        captcha_id = data['request']
+
+        for _ in range(self.default_timeout // self.polling_interval):
+            await asyncio.sleep(self.polling_interval)
+
+            async with session.get('https://2captcha.com/res.php', params={
+                'key': self.twocaptcha_key,
+                'action': 'get',
+                'id': captcha_id,
+                'json': 1
+            }) as result:
+                data = await result.json()
+
+            if data.get('status') == 1:
+                return data['request']
+            if data.get('request') != 'CAPCHA_NOT_READY':
+                return None
+
+        return None
+
+    async def _poll_task_api_async(self, session, base_url: str, client_key: str,
+                                   task_type: str, task_data: Dict) -> Optional[str]:
+        """Submit/poll a createTask-style API (capsolver, anti-captcha)"""
+        async with session.post(f'{base_url}/createTask', json={
+            'clientKey': client_key,
+            'task': {'type': task_type, **task_data}
+        }) as response:
+            data = await response.json()
+
+        if data.get('errorId') != 0:
+            return None
+        task_id = data['taskId']
+
+        # Exponential backoff: fast providers answer in seconds, slow
+        # ones shouldn't be hammered - ramp from 3s up to 15s
+        deadline = asyncio.get_event_loop().time() + self.default_timeout
+        wait = 3.0
+        while asyncio.get_event_loop().time() < deadline:
+            await asyncio.sleep(wait)
+            wait = min(wait * 1.5, 15.0)
+
+            async with session.post(f'{base_url}/getTaskResult', json={
+                'clientKey': client_key,
+                'taskId': task_id
+            }) as result:
+                data = await result.json()
+
+            if data.get('errorId') != 0:
+                return None
+            if data.get('status') == 'ready':
+                solution = data['solution']
+                for field in ('gRecaptchaResponse', 'token', 'answer', 'validate'):
+                    if field in solution:
+                        return solution[field]
+                return json.dumps(solution)
+
+        return None
+
+    async def solve_recaptcha_v2_async(self, site_key: str, url: str, **kwargs) -> Optional[str]:
+        """Race every configured provider concurrently - first token wins"""
+
+        if aiohttp is None:
+            raise ImportError("aiohttp is not installed - pip install aiohttp")
+
+        timeout = aiohttp.ClientTimeout(total=self.default_timeout + 30)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            tasks = []
+            if self.twocaptcha_key:
+                tasks.append(asyncio.ensure_future(self._poll_2captcha_async(session, {
                     'key': self.twocaptcha_key,
                     'method': 'userrecaptcha',
                     'googlekey': site_key,
                     'pageurl': url,
                     'json': 1
-                })
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get('status') == 1:
-                        captcha_id = data['request']
-                        
-                        # Wait for solution
-                        for _ in range(self.default_timeout // self.polling_interval):
-                            time.sleep(self.polling_interval)
-                            
-                            result = requests.get('https://2captcha.com/res.php', params={
-                                'key': self.twocaptcha_key,
-                                'action': 'get',
-                                'id': captcha_id,
-                                'json': 1
-                            })
-                            
-                            if result.status_code == 200:
-                                data = result.json()
-                                if data.get('status') == 1:
-                                    self.logger.info("reCAPTCHA v2 solved with 2captcha")
-                                    return data['request']
-                                elif data.get('request') == 'CAPCHA_NOT_READY':
-                                    continue
-                                else:
-                                    break
-                                    
+                })))
+            if self.capsolver_key:
+                tasks.append(asyncio.ensure_future(self._poll_task_api_async(
+                    session, 'https://api.capsolver.com', self.capsolver_key,
+                    'ReCaptchaV2Task',
+                    {'websiteURL': url, 'websiteKey': site_key})))
+            if self.anti_captcha_key:
+                tasks.append(asyncio.ensure_future(self._poll_task_api_async(
+                    session, 'https://api.anti-captcha.com', self.anti_captcha_key,
+                    'NoCaptchaTaskProxyless',
+                    {'websiteURL': url, 'websiteKey': site_key})))
+
+            if not tasks:
+                return None
+
+            solution = None
+            pending = tasks
+            while pending and solution is None:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    try:
+                        token = task.result()
+                    except Exception as e:
+                        self.logger.debug(f"Provider task failed: {str(e)}")
+                        continue
+                    if token:
+                        solution = token
+                        break
+
+            # Losers get cancelled - no point paying for a second solve
+            for task in pending:
+                task.cancel()
+
+            return solution
+
+    def solve_recaptcha_v2(self, site_key: str, url: str, **kwargs) -> Optional[str]:
+        """Solve reCAPTCHA v2"""
+
+        # With several providers configured, race them concurrently so the
+        # solve latency is the fastest provider's, not the sum of retries
+        providers = sum(map(bool, (self.twocaptcha_key, self.capsolver_key,
+                                   self.anti_captcha_key)))
+        if aiohttp is not None and providers > 1:
+            try:
+                return asyncio.run(self.solve_recaptcha_v2_async(site_key, url))
             except Exception as e:
-                self.logger.error(f"2captcha error: {str(e)}")
+                self.logger.error(f"Provider race failed, falling back: {str(e)}")
+
+        # Try 2captcha first
+        if self.twocaptcha_key:
+            token = self._twocaptcha_solve({
+                'method': 'userrecaptcha',
+                'googlekey': site_key,
+                'pageurl': url
+            })
+            if token:
+                self.logger.info("reCAPTCHA v2 solved with 2captcha")
+                return token
         
         # Try capsolver
         if self.capsolver_key:
@@ -436,39 +845,17 @@ class CaptchaSolver:
         
         if self.twocaptcha_key:
             # 2captcha v3 support
-            response = requests.post('https://2captcha.com/in.php', data={
-                'key': self.twocaptcha_key,
+            return self._twocaptcha_solve({
                 'method': 'userrecaptcha',
                 'version': 'v3',
                 'googlekey': site_key,
                 'pageurl': url,
                 'action': action,
-                'min_score': min_score,
-                'json': 1
+                'min_score': min_score
             })
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('status') == 1:
-                    captcha_id = data['request']
-                    
-                    for _ in range(self.default_timeout // self.polling_interval):
-                        time.sleep(self.polling_interval)
-                        
-                        result = requests.get('https://2captcha.com/res.php', params={
-                            'key': self.twocaptcha_key,
-                            'action': 'get',
-                            'id': captcha_id,
-                            'json': 1
-                        })
-                        
-                        if result.status_code == 200:
-                            data = result.json()
-                            if data.get('status') == 1:
-                                return data['request']
-        
+
         return None
-    
+
     def solve_hcaptcha(self, site_key: str, url: str, **kwargs) -> Optional[str]:
         """Solve hCaptcha"""
         
@@ -479,34 +866,12 @@ class CaptchaSolver:
             })
         
         if self.twocaptcha_key:
-            response = requests.post('https://2captcha.com/in.php', data={
-                'key': self.twocaptcha_key,
+            return self._twocaptcha_solve({
                 'method': 'hcaptcha',
                 'sitekey': site_key,
-                'pageurl': url,
-                'json': 1
+                'pageurl': url
             })
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('status') == 1:
-                    captcha_id = data['request']
-                    
-                    for _ in range(self.default_timeout // self.polling_interval):
-                        time.sleep(self.polling_interval)
-                        
-                        result = requests.get('https://2captcha.com/res.php', params={
-                            'key': self.twocaptcha_key,
-                            'action': 'get',
-                            'id': captcha_id,
-                            'json': 1
-                        })
-                        
-                        if result.status_code == 200:
-                            data = result.json()
-                            if data.get('status') == 1:
-                                return data['request']
-        
+
         return None
     
     def solve_image_captcha(self, image_data: bytes = None, element: WebElement = None, 
@@ -519,76 +884,90 @@ class CaptchaSolver:
         
         if not image_data:
             return None
-        
+
+        # Same image seen before? A hash lookup beats OCR by orders of
+        # magnitude and a remote solve by several seconds
+        img_hash = _perceptual_hash(image_data)
+        if img_hash is not None:
+            cached = self._img_sol_cache.get(img_hash)
+            if cached:
+                self.logger.info("Image captcha matched perceptual-hash cache")
+                return cached
+
         # Try OCR first
         if self.use_ocr and self.ocr_available:
             try:
-                # Preprocess image
+                # Preprocess image - go straight to grayscale: the pipeline
+                # never uses color, so the RGB->BGR intermediate buffer and
+                # the extra cvtColor pass were pure memory traffic
                 image = Image.open(BytesIO(image_data))
-                
-                # Convert to OpenCV format
-                cv_image = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-                
+                if image.mode != 'RGB':
+                    image = image.convert('RGB')
+                gray = cv2.cvtColor(np.asarray(image), cv2.COLOR_RGB2GRAY)
+
                 # Preprocessing pipeline
-                processed = self.preprocess_image(cv_image)
-                
-                # Perform OCR with multiple configs
-                configs = [
-                    '--psm 8 -c tessedit_char_whitelist=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ',
-                    '--psm 8 -c tessedit_char_whitelist=0123456789abcdefghijklmnopqrstuvwxyz',
-                    '--psm 8'
-                ]
-                
-                for config in configs:
-                    text = pytesseract.image_to_string(processed, config=config)
-                    text = text.strip().replace(' ', '').upper()
-                    
-                    if text and len(text) >= 4 and len(text) <= 8:
-                        self.logger.info(f"OCR solved captcha: {text}")
-                        return text
-                        
+                processed = self.preprocess_image(gray)
+
+                text = self._ocr_image(processed)
+                if text:
+                    self.logger.info(f"OCR solved captcha: {text}")
+                    self._store_image_solution(img_hash, text)
+                    return text
+
             except Exception as e:
                 self.logger.debug(f"OCR failed: {str(e)}")
         
         # Try 2captcha
         if self.twocaptcha_key:
-            try:
-                # Encode image
-                encoded = base64.b64encode(image_data).decode('utf-8')
-                
-                response = requests.post('https://2captcha.com/in.php', data={
-                    'key': self.twocaptcha_key,
-                    'method': 'base64',
-                    'body': encoded,
-                    'json': 1
-                })
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get('status') == 1:
-                        captcha_id = data['request']
-                        
-                        for _ in range(self.default_timeout // self.polling_interval):
-                            time.sleep(self.polling_interval)
-                            
-                            result = requests.get('https://2captcha.com/res.php', params={
-                                'key': self.twocaptcha_key,
-                                'action': 'get',
-                                'id': captcha_id,
-                                'json': 1
-                            })
-                            
-                            if result.status_code == 200:
-                                data = result.json()
-                                if data.get('status') == 1:
-                                    return data['request']
-                                    
-            except Exception as e:
-                self.logger.error(f"2captcha image solve failed: {str(e)}")
-        
+            solution = self._twocaptcha_solve({
+                'method': 'base64',
+                'body': base64.b64encode(image_data).decode('utf-8')
+            })
+            if solution:
+                self._store_image_solution(img_hash, solution)
+            return solution
+
         return None
+
+    def _store_image_solution(self, img_hash: Optional[int], solution: str):
+        """Remember an image solution keyed by its perceptual hash"""
+        if img_hash is None:
+            return
+        self._img_sol_cache[img_hash] = solution
+        if LRUCache is None and len(self._img_sol_cache) > 1024:
+            self._img_sol_cache.popitem(last=False)
     
-    def solve_text_captcha(self, question: str = None, element: WebElement = None, 
+    _OCR_WHITELISTS = (
+        '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ',
+        '0123456789abcdefghijklmnopqrstuvwxyz',
+        ''
+    )
+
+    def _ocr_image(self, processed: np.ndarray) -> Optional[str]:
+        """Run OCR over a preprocessed image, trying each whitelist"""
+
+        if self._tess is not None:
+            # In-process API: swap the whitelist variable between attempts
+            # instead of spawning a fresh tesseract per config
+            pil_image = Image.fromarray(processed)
+            for whitelist in self._OCR_WHITELISTS:
+                self._tess.SetVariable('tessedit_char_whitelist', whitelist)
+                self._tess.SetImage(pil_image)
+                text = _clean_ocr_text(self._tess.GetUTF8Text())
+                if text:
+                    return text
+            return None
+
+        for whitelist in self._OCR_WHITELISTS:
+            config = '--psm 8'
+            if whitelist:
+                config += f' -c tessedit_char_whitelist={whitelist}'
+            text = _clean_ocr_text(pytesseract.image_to_string(processed, config=config))
+            if text:
+                return text
+        return None
+
+    def solve_text_captcha(self, question: str = None, element: WebElement = None,
                           **kwargs) -> Optional[str]:
         """Solve text-based captcha questions"""
         
@@ -598,35 +977,18 @@ class CaptchaSolver:
         elif not question:
             return None
         
-        # Common math patterns
-        math_patterns = [
-            (r'what is (\d+)\s*\+\s*(\d+)', lambda m: str(int(m.group(1)) + int(m.group(2)))),
-            (r'what is (\d+)\s*\-\s*(\d+)', lambda m: str(int(m.group(1)) - int(m.group(2)))),
-            (r'what is (\d+)\s*\*\s*(\d+)', lambda m: str(int(m.group(1)) * int(m.group(2)))),
-            (r'what is (\d+)\s*\/\s*(\d+)', lambda m: str(int(m.group(1)) // int(m.group(2)))),
-            (r'(\d+)\s*\+\s*(\d+)\s*=', lambda m: str(int(m.group(1)) + int(m.group(2)))),
-            (r'(\d+)\s*\-\s*(\d+)\s*=', lambda m: str(int(m.group(1)) - int(m.group(2)))),
-        ]
-        
-        for pattern, calculator in math_patterns:
-            match = re.search(pattern, question, re.IGNORECASE)
-            if match:
-                return calculator(match)
-        
+        # Arithmetic questions - one scan, operators dispatched by table
+        match = _MATH_RE.search(question)
+        if match:
+            a, op, b = match.groups()
+            return str(_MATH_OPS[op.lower()](int(a), int(b)))
+
         # Word patterns
-        word_patterns = {
-            r'type the word ["\']?(\w+)["\']?': lambda m: m.group(1),
-            r'enter the text:?\s*["\']?(\w+)["\']?': lambda m: m.group(1),
-            r'what color is the sky': lambda m: 'blue',
-            r'what color is grass': lambda m: 'green',
-            r'what is the capital of france': lambda m: 'paris',
-            r'what is the capital of usa': lambda m: 'washington',
-        }
-        
-        for pattern, answer_func in word_patterns.items():
-            if re.search(pattern, question, re.IGNORECASE):
-                return answer_func(None)
-        
+        for pattern, answer in _WORD_PATTERNS:
+            match = pattern.search(question)
+            if match:
+                return match.group(1) if answer is None else answer
+
         return None
     
     def solve_math_captcha(self, question: str = None, **kwargs) -> Optional[str]:
@@ -643,34 +1005,12 @@ class CaptchaSolver:
             })
         
         if self.twocaptcha_key:
-            response = requests.post('https://2captcha.com/in.php', data={
-                'key': self.twocaptcha_key,
+            return self._twocaptcha_solve({
                 'method': 'funcaptcha',
                 'publickey': public_key,
-                'pageurl': url,
-                'json': 1
+                'pageurl': url
             })
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('status') == 1:
-                    captcha_id = data['request']
-                    
-                    for _ in range(self.default_timeout // self.polling_interval):
-                        time.sleep(self.polling_interval)
-                        
-                        result = requests.get('https://2captcha.com/res.php', params={
-                            'key': self.twocaptcha_key,
-                            'action': 'get',
-                            'id': captcha_id,
-                            'json': 1
-                        })
-                        
-                        if result.status_code == 200:
-                            data = result.json()
-                            if data.get('status') == 1:
-                                return data['request']
-        
+
         return None
     
     def solve_geetest(self, gt: str, challenge: str, url: str, **kwargs) -> Optional[Dict]:
@@ -690,35 +1030,13 @@ class CaptchaSolver:
                     pass
         
         if self.twocaptcha_key:
-            response = requests.post('https://2captcha.com/in.php', data={
-                'key': self.twocaptcha_key,
+            return self._twocaptcha_solve({
                 'method': 'geetest',
                 'gt': gt,
                 'challenge': challenge,
-                'pageurl': url,
-                'json': 1
+                'pageurl': url
             })
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('status') == 1:
-                    captcha_id = data['request']
-                    
-                    for _ in range(self.default_timeout // self.polling_interval):
-                        time.sleep(self.polling_interval)
-                        
-                        result = requests.get('https://2captcha.com/res.php', params={
-                            'key': self.twocaptcha_key,
-                            'action': 'get',
-                            'id': captcha_id,
-                            'json': 1
-                        })
-                        
-                        if result.status_code == 200:
-                            data = result.json()
-                            if data.get('status') == 1:
-                                return data['request']
-        
+
         return None
     
     def solve_turnstile(self, site_key: str, url: str, **kwargs) -> Optional[str]:
@@ -740,7 +1058,7 @@ class CaptchaSolver:
         
         try:
             # Create task
-            response = requests.post('https://api.capsolver.com/createTask', json={
+            response = self._sess.post('https://api.capsolver.com/createTask', timeout=10, json={
                 'clientKey': self.capsolver_key,
                 'task': {
                     'type': task_type,
@@ -757,7 +1075,7 @@ class CaptchaSolver:
                     for _ in range(self.default_timeout // 3):
                         time.sleep(3)
                         
-                        result = requests.post('https://api.capsolver.com/getTaskResult', json={
+                        result = self._sess.post('https://api.capsolver.com/getTaskResult', timeout=10, json={
                             'clientKey': self.capsolver_key,
                             'taskId': task_id
                         })
@@ -785,15 +1103,37 @@ class CaptchaSolver:
         
         return None
     
+    async def solve_with_anticaptcha_async(self, task_type: str, task_data: Dict) -> Optional[str]:
+        """Solve via anti-captcha without blocking the thread"""
+
+        if aiohttp is None:
+            raise ImportError("aiohttp is not installed - pip install aiohttp")
+        if not self.anti_captcha_key:
+            return None
+
+        timeout = aiohttp.ClientTimeout(total=self.default_timeout + 30)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            return await self._poll_task_api_async(
+                session, 'https://api.anti-captcha.com', self.anti_captcha_key,
+                task_type, task_data)
+
     def solve_with_anticaptcha(self, task_type: str, task_data: Dict) -> Optional[str]:
         """Solve captcha using anti-captcha.com"""
-        
+
         if not self.anti_captcha_key:
             return None
-        
+
+        # Prefer the event-loop poller - it backs off between checks and
+        # lets several captchas share one loop instead of sleeping a thread
+        if aiohttp is not None:
+            try:
+                return asyncio.run(self.solve_with_anticaptcha_async(task_type, task_data))
+            except Exception as e:
+                self.logger.debug(f"Async anti-captcha poll failed, falling back: {str(e)}")
+
         try:
             # Create task
-            response = requests.post('https://api.anti-captcha.com/createTask', json={
+            response = self._sess.post('https://api.anti-captcha.com/createTask', timeout=10, json={
                 'clientKey': self.anti_captcha_key,
                 'task': {
                     'type': task_type,
@@ -810,7 +1150,7 @@ class CaptchaSolver:
                     for _ in range(self.default_timeout // 3):
                         time.sleep(3)
                         
-                        result = requests.post('https://api.anti-captcha.com/getTaskResult', json={
+                        result = self._sess.post('https://api.anti-captcha.com/getTaskResult', timeout=10, json={
                             'clientKey': self.anti_captcha_key,
                             'taskId': task_id
                         })
@@ -832,66 +1172,107 @@ class CaptchaSolver:
     
     def preprocess_image(self, image: np.ndarray) -> np.ndarray:
         """Preprocess image for better OCR"""
-        
+
+        # Hashing the pixels is ~20x cheaper than the filter pipeline, so
+        # repeated captchas come straight from the cache
+        cache_key = hashlib.blake2b(image.tobytes(), digest_size=8).digest()
+        cached = self._pre_cache.get(cache_key)
+        if cached is not None:
+            self._pre_cache.move_to_end(cache_key)
+            return cached
+
         # Convert to grayscale
         if len(image.shape) == 3:
             gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         else:
             gray = image
         
-        # Apply Gaussian blur
-        blurred = cv2.GaussianBlur(gray, (3, 3), 0)
-        
+        # Apply Gaussian blur as two separable 1-D passes
+        blurred = cv2.sepFilter2D(gray, -1, _GAUSS_KERNEL, _GAUSS_KERNEL)
+
         # Adaptive thresholding
         thresh = cv2.adaptiveThreshold(blurred, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
                                        cv2.THRESH_BINARY_INV, 11, 2)
-        
+
         # Remove noise
-        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))
-        cleaned = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, kernel)
-        cleaned = cv2.morphologyEx(cleaned, cv2.MORPH_OPEN, kernel)
-        
+        cleaned = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, _MORPH_KERNEL)
+        cleaned = cv2.morphologyEx(cleaned, cv2.MORPH_OPEN, _MORPH_KERNEL)
+
+        self._pre_cache[cache_key] = cleaned
+        if len(self._pre_cache) > self._pre_cache_size:
+            self._pre_cache.popitem(last=False)
+
         return cleaned
     
+    def _cache_get(self, cache_key: str) -> Optional[str]:
+        """Look up a cached solution, expiring stale fallback entries"""
+        if TTLCache is not None:
+            return self.solution_cache.get(cache_key)
+
+        entry = self.solution_cache.get(cache_key)
+        if not entry:
+            return None
+        cache_time, solution = entry
+        if time.time() - cache_time >= self.cache_ttl:
+            del self.solution_cache[cache_key]
+            return None
+        return solution
+
+    def _cache_put(self, cache_key: str, solution: str):
+        """Store a solution, evicting the oldest entry when full"""
+        if TTLCache is not None:
+            self.solution_cache[cache_key] = solution
+            return
+
+        self.solution_cache[cache_key] = (time.time(), solution)
+        if len(self.solution_cache) > self._cache_max:
+            self.solution_cache.popitem(last=False)
+
     def get_cache_key(self, captcha_type: str, kwargs: Dict) -> str:
         """Generate cache key for captcha solution"""
-        # Create deterministic string from parameters
-        param_str = f"{captcha_type}:"
+        # Deterministic digest over the serializable parameters
+        parts = [captcha_type]
         for key in sorted(kwargs.keys()):
-            if key not in ['element', 'driver']:  # Exclude non-serializable objects
-                param_str += f"{key}={kwargs.get(key)}|"
-        
-        return hashlib.md5(param_str.encode()).hexdigest()
+            if key not in ('element', 'driver'):  # Exclude non-serializable objects
+                parts.append(f"{key}={kwargs.get(key)}")
+
+        return hashlib.blake2b('|'.join(parts).encode(), digest_size=16).hexdigest()
     
     def inject_solution(self, driver, token: str, captcha_type: str = 'recaptcha_v2'):
         """Inject solved captcha token into page"""
         
+        # The token travels as a script argument rather than being
+        # interpolated into the source: the JS text stays identical
+        # across calls (so the browser can reuse its compiled form) and
+        # tokens containing quotes can't break the script
         if captcha_type in ['recaptcha_v2', 'recaptcha_v3']:
             # Inject reCAPTCHA response
-            script = f"""
-                document.getElementById('g-recaptcha-response').innerHTML = '{token}';
+            script = """
+                var token = arguments[0];
+                document.getElementById('g-recaptcha-response').innerHTML = token;
                 document.getElementById('g-recaptcha-response').style.display = 'block';
-                
+
                 // Trigger callback if exists
-                if (typeof ___grecaptcha_cfg !== 'undefined') {{
-                    for (let i = 0; i < ___grecaptcha_cfg.clients.length; i++) {{
-                        if (___grecaptcha_cfg.clients[i] && 
-                            typeof ___grecaptcha_cfg.clients[i].callback === 'function') {{
-                            ___grecaptcha_cfg.clients[i].callback('{token}');
-                        }}
-                    }}
-                }}
+                if (typeof ___grecaptcha_cfg !== 'undefined') {
+                    for (let i = 0; i < ___grecaptcha_cfg.clients.length; i++) {
+                        if (___grecaptcha_cfg.clients[i] &&
+                            typeof ___grecaptcha_cfg.clients[i].callback === 'function') {
+                            ___grecaptcha_cfg.clients[i].callback(token);
+                        }
+                    }
+                }
             """
-            driver.execute_script(script)
-            
+            driver.execute_script(script, token)
+
         elif captcha_type == 'hcaptcha':
-            script = f"""
-                document.querySelector('[name="h-captcha-response"]').innerHTML = '{token}';
-                if (typeof hcaptcha !== 'undefined') {{
+            script = """
+                var token = arguments[0];
+                document.querySelector('[name="h-captcha-response"]').innerHTML = token;
+                if (typeof hcaptcha !== 'undefined') {
                     hcaptcha.setResponse(token);
-                }}
+                }
             """
-            driver.execute_script(script)
+            driver.execute_script(script, token)
         
         # Try to submit form
         try:
@@ -6,6 +6,7 @@ import random
 import logging
 import os
 import time
+from collections import deque
 from typing import Optional, List
 from colorama import Fore, Style
 
@@ -18,6 +19,10 @@ class ProxyRotator:
         self.proxies = self.load_proxies()
         self.current_index = 0
         self.failed_proxies = set()
+        # Live proxies in rotation order; failed ones are parked in
+        # _dead so get_proxy never has to re-draw and re-check
+        self._live = deque(self.proxies)
+        self._dead = deque()
         
     def load_proxies(self) -> List[str]:
         """Load proxies from file"""
@@ -57,26 +62,29 @@ class ProxyRotator:
         if not self.proxies:
             return None
         
-        # Try to get a working proxy
-        attempts = 0
-        max_attempts = len(self.proxies) * 2
-        
-        while attempts < max_attempts:
-            proxy = random.choice(self.proxies)
-            if proxy not in self.failed_proxies:
-                self.current_index = (self.current_index + 1) % len(self.proxies)
-                return proxy
-            attempts += 1
-        
-        # If all proxies failed, reset and try any
-        self.logger.warning("All proxies have failed, resetting failed list")
-        self.failed_proxies.clear()
-        return random.choice(self.proxies) if self.proxies else None
+        if not self._live:
+            # All proxies failed - reset and put them back in rotation
+            self.logger.warning("All proxies have failed, resetting failed list")
+            self.failed_proxies.clear()
+            self._live.extend(self._dead)
+            self._dead.clear()
+
+        # O(1) rotation: take the head, move it to the back. No random
+        # draws, no failed-set rechecks, no retry loop.
+        proxy = self._live[0]
+        self._live.rotate(-1)
+        self.current_index = (self.current_index + 1) % len(self.proxies)
+        return proxy
     
     def mark_failed(self, proxy: str):
         """Mark a proxy as failed"""
-        if proxy:
+        if proxy and proxy not in self.failed_proxies:
             self.failed_proxies.add(proxy)
+            try:
+                self._live.remove(proxy)
+                self._dead.append(proxy)
+            except ValueError:
+                pass
             self.logger.warning(f"Proxy marked as failed: {proxy}")
     
     def has_proxies(self) -> bool:
@@ -23,12 +23,14 @@ class RateLimiter:
         self.max_delay = smart_delay.get('max_delay', 5)
         self.jitter = smart_delay.get('jitter', True)
         
-        # Tracking
+        # Tracking. request_times is kept for stats only; pacing itself
+        # is a single float, so the hot path never walks the deque.
         self.request_times = deque(maxlen=100)
         self.ip_request_counts = {}
         self.lock = threading.Lock()
         self.last_request_time = 0
         self.consecutive_failures = 0
+        self._next_allowed_time = 0.0
         
         # Adaptive rate limiting
         self.current_rate = self.requests_per_minute
@@ -37,40 +39,42 @@ class RateLimiter:
         self.rate_adjustment_factor = 0.9
         
     def wait_if_needed(self, ip_address: str = None):
-        """Wait if rate limit would be exceeded"""
+        """Wait if rate limit would be exceeded.
+
+        Each request reserves a time slot under a short lock and sleeps
+        outside it. The old version slept while holding the lock, which
+        serialized every worker thread behind whichever one was waiting.
+        The rate is enforced as a minimum interval between requests -
+        same throughput bound as the sliding window, O(1) state.
+        """
+        delay = self.calculate_delay()
+
         with self.lock:
             now = time.time()
-            
-            # Clean old requests
-            while self.request_times and self.request_times[0] < now - 60:
-                self.request_times.popleft()
-            
-            # Check global rate limit
-            if len(self.request_times) >= self.current_rate:
-                sleep_time = self.request_times[0] + 60 - now
-                if sleep_time > 0:
-                    self.logger.debug(f"Rate limit reached, waiting {sleep_time:.2f}s")
-                    time.sleep(sleep_time)
-            
+            slot = max(now, self._next_allowed_time)
+            # Space requests by the adaptive rate, or by the smart
+            # delay when that is longer
+            self._next_allowed_time = slot + max(60.0 / self.current_rate, delay)
+
             # Check IP-based rate limit
-            if ip_address and ip_address in self.ip_request_counts:
-                if self.ip_request_counts[ip_address] >= self.requests_per_ip:
-                    sleep_time = self.cooldown_period
-                    self.logger.debug(f"IP {ip_address} rate limit reached, waiting {sleep_time}s")
-                    time.sleep(sleep_time)
-                    self.ip_request_counts[ip_address] = 0
-            
-            # Smart delay
-            delay = self.calculate_delay()
-            if delay > 0:
-                time.sleep(delay)
-            
-            # Update tracking
-            self.request_times.append(now)
+            ip_wait = 0.0
             if ip_address:
-                self.ip_request_counts[ip_address] = self.ip_request_counts.get(ip_address, 0) + 1
-            
+                count = self.ip_request_counts.get(ip_address, 0)
+                if count >= self.requests_per_ip:
+                    ip_wait = self.cooldown_period
+                    self.logger.debug(f"IP {ip_address} rate limit reached, waiting {ip_wait}s")
+                    count = 0
+                self.ip_request_counts[ip_address] = count + 1
+
+            # Stats only - O(1) append, never iterated here
+            self.request_times.append(slot)
             self.last_request_time = now
+
+        sleep_time = (slot - now) + ip_wait
+        if sleep_time > 0:
+            if slot > now:
+                self.logger.debug(f"Rate limit pacing, waiting {sleep_time:.2f}s")
+            time.sleep(sleep_time)
     
     def calculate_delay(self) -> float:
         """Calculate smart delay based on various factors"""
@@ -113,10 +117,7 @@ class RateLimiter:
     def get_wait_time(self) -> float:
         """Get current wait time without actually waiting"""
         with self.lock:
-            now = time.time()
-            if len(self.request_times) >= self.current_rate:
-                return max(0, self.request_times[0] + 60 - now)
-            return 0
+            return max(0.0, self._next_allowed_time - time.time())
     
     def reset(self):
         """Reset rate limiter"""
@@ -125,6 +126,7 @@ class RateLimiter:
             self.ip_request_counts.clear()
             self.consecutive_failures = 0
             self.current_rate = self.max_rate
+            self._next_allowed_time = 0.0
             self.logger.info("Rate limiter reset")
     
     def get_stats(self) -> dict:
@@ -132,13 +134,15 @@ class RateLimiter:
         with self.lock:
             now = time.time()
             requests_last_minute = len([t for t in self.request_times if t > now - 60])
-            
+
             return {
                 'requests_last_minute': requests_last_minute,
                 'current_rate_limit': self.current_rate,
                 'consecutive_failures': self.consecutive_failures,
                 'active_ips': len(self.ip_request_counts),
-                'wait_time': self.get_wait_time()
+                # Computed inline: get_wait_time() takes the same
+                # non-reentrant lock we are already holding
+                'wait_time': max(0.0, self._next_allowed_time - now)
             }
 
 class AdaptiveRateLimiter(RateLimiter):
@@ -183,30 +187,61 @@ class AdaptiveRateLimiter(RateLimiter):
         
         return base_delay
 
+# Fixed-window counter evaluated atomically server-side: bump the
+# counter, start the window on first hit, and return how long to wait
+# (ms) when over the limit - one round trip, no client-side races
+_RATE_LIMIT_LUA = """
+local c = redis.call('INCR', KEYS[1])
+if c == 1 then
+    redis.call('PEXPIRE', KEYS[1], 60000)
+end
+if c > tonumber(ARGV[1]) then
+    return redis.call('PTTL', KEYS[1])
+end
+return 0
+"""
+
 class DistributedRateLimiter:
     """Rate limiter for distributed scraping"""
-    
+
     def __init__(self, redis_client, config: dict):
         self.redis = redis_client
         self.config = config
         self.key_prefix = "rate_limiter:"
         self.logger = logging.getLogger(__name__)
-        
+        try:
+            self._limit_script = redis_client.register_script(_RATE_LIMIT_LUA)
+        except Exception:
+            # Client without script support - use the plain commands
+            self._limit_script = None
+
     def wait_if_needed(self, key: str = "global"):
         """Distributed rate limiting using Redis"""
         redis_key = f"{self.key_prefix}{key}"
-        
+        limit = self.config.get('requests_per_minute', 30)
+
+        if self._limit_script is not None:
+            # One atomic EVALSHA per attempt; the script tells us
+            # exactly how long until the window resets instead of
+            # polling every second
+            while True:
+                sleep_ms = int(self._limit_script(keys=[redis_key], args=[limit]))
+                if sleep_ms <= 0:
+                    return
+                time.sleep(sleep_ms / 1000.0)
+
+        # Fallback: non-atomic GET/INCR (may overshoot under concurrency)
         while True:
             current = self.redis.get(redis_key)
             if current is None:
                 self.redis.setex(redis_key, 60, 1)
                 break
-            
+
             count = int(current)
-            if count < self.config.get('requests_per_minute', 30):
+            if count < limit:
                 self.redis.incr(redis_key)
                 break
-            
+
             # Wait and retry
             time.sleep(1)
     
@@ -219,7 +254,9 @@ class DistributedRateLimiter:
     def get_global_stats(self) -> dict:
         """Get global rate limiting stats"""
         stats = {}
-        for key in self.redis.keys(f"{self.key_prefix}*"):
+        # SCAN iterates incrementally instead of KEYS blocking the
+        # server on an O(N) keyspace walk
+        for key in self.redis.scan_iter(match=f"{self.key_prefix}*"):
             count = self.redis.get(key)
             stats[key.decode()] = int(count) if count else 0
         return stats